@@ -18,6 +18,10 @@ import logger
 
 log = logger.get_logger(__name__)
 
+# concurrent requests (async_req=True or from thread pools) reuse the keep-alive
+# connections of the client pool, instead of opening and discarding extra ones
+MAX_CONCURRENT_REQUESTS = 16
+
 
 class SecretType(Enum):
     """Type of Secrets"""
@@ -309,7 +313,6 @@ class Kubernetes:  # pylint: disable=too-many-public-methods
     # add/modify resources easily checking:
     #    https://github.com/kubernetes-client/python/tree/master/kubernetes/docs
     def __init__(self, kubeconfig: Optional[dict] = None) -> None:
-        api_client: Optional[client.ApiClient] = None
         if kubeconfig:
             log.debug(
                 "connection to k8s cluster using kubeconfig and service account credentials"
@@ -322,7 +325,6 @@ class Kubernetes:  # pylint: disable=too-many-public-methods
                 configuration = client.Configuration()
                 loader = config.kube_config.KubeConfigLoader(kubeconfig)
                 loader.load_and_set(configuration)
-            api_client = client.ApiClient(configuration)
         else:
             try:
                 config.load_incluster_config()
@@ -330,6 +332,11 @@ class Kubernetes:  # pylint: disable=too-many-public-methods
             except config.ConfigException:
                 config.load_kube_config()
                 log.debug("local connection to k8s")
+            configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = MAX_CONCURRENT_REQUESTS
+        api_client = client.ApiClient(
+            configuration, pool_threads=MAX_CONCURRENT_REQUESTS
+        )
         self.core_api = client.CoreV1Api(api_client)
         self.batch_api = client.BatchV1Api(api_client)
         self.apps_api = client.AppsV1Api(api_client)
@@ -339,6 +346,11 @@ class Kubernetes:  # pylint: disable=too-many-public-methods
         self.custom_api = client.CustomObjectsApi(api_client)
         self.watch = watch.Watch()
 
+    @staticmethod
+    def new_watch() -> watch.Watch:
+        """A watch per stream, so concurrent waits do not stop each other"""
+        return watch.Watch()
+
     def check_authorization(
         self, group: str, resource: str, verb: str, namespace: str
     ) -> bool:
@@ -36,10 +36,33 @@ import logger
 
 log = logger.get_logger(__name__)
 
+
+def error_body(ex: ApiException) -> dict:
+    """body of the api exception, parsed only once and kept on the exception"""
+    if (body := getattr(ex, "_parsed_body", None)) is None:
+        body = json.loads(ex.body)
+        ex._parsed_body = body  # type: ignore[attr-defined]
+    return body
+
+
 # Accepted in most names
 # K8S_NAME_RE = re.compile("[a-z0-9]([-a-z0-9]*[a-z0-9])?(\\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*")
 # Most restrictive names
-K8S_NAME_RE = re.compile("[a-z0-9]([-a-z0-9]*[a-z0-9])?")
+K8S_NAME_RE = re.compile("[a-z0-9](?:[-a-z0-9]*[a-z0-9])?")
+# k8s object names can not exceed 63 chars
+MAX_NAME_LENGTH = 63
+# the descriptive role binding name adds "sa-" and "-role" to the short one
+ROLE_BINDING_PREFIXES_LENGTH = len("sa-") + len("-role")
+
+
+def role_binding_name(sa_name: str, role_name: str) -> str:
+    """name of the role binding, the descriptive one if it is not too long"""
+    short_name = f"{sa_name}-{role_name}"
+    if len(short_name) + ROLE_BINDING_PREFIXES_LENGTH <= MAX_NAME_LENGTH:
+        return f"sa-{sa_name}-role-{role_name}"
+    if len(short_name) <= MAX_NAME_LENGTH:
+        return short_name
+    raise ValueError(f"role binding name {short_name} is too long")
 
 
 @dataclass  # type: ignore
@@ -50,9 +73,29 @@ class K8sModel(ABC):
     API: ClassVar[str]
     API_FUNC: ClassVar[str]
     NAMESPACED: ClassVar[bool] = True
+    # names resolved once per subclass, see __init_subclass__
+    _api_attr: ClassVar[str]
+    _read_name: ClassVar[str]
+    _patch_name: ClassVar[str]
+    _create_name: ClassVar[str]
+    _delete_name: ClassVar[str]
+    _list_name: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """resolves the api attribute and method names of the subclass"""
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "API"):
+            cls._api_attr = f"{cls.API}_api"
+        if hasattr(cls, "API_FUNC"):
+            suffix = f"{'_namespaced' if cls.NAMESPACED else ''}_{cls.API_FUNC}"
+            cls._read_name = f"read{suffix}"
+            cls._patch_name = f"patch{suffix}"
+            cls._create_name = f"create{suffix}"
+            cls._delete_name = f"delete{suffix}"
+            cls._list_name = f"list{suffix}"
 
     def __post_init__(self) -> None:
-        if not bool(K8S_NAME_RE.fullmatch(self.name)):
+        if not K8S_NAME_RE.fullmatch(self.name):
             # a lowercase RFC 1123 subdomain must consist of lower case alphanumeric characters, '-' or '.',
             # and must start and end with an alphanumeric character
             # (e.g. 'example.com', regex used for validation is '[a-z0-9]([-a-z0-9]*[a-z0-9])?(\\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*')
@@ -110,7 +153,7 @@ class K8sModel(ABC):
         self, k8s: k8s_client.Kubernetes
     ) -> client.CoreV1Api | client.BatchV1Api | client.AppsV1Api:
         """api required by the kubernetes object"""
-        return getattr(k8s, f"{self.API}_api")
+        return getattr(k8s, self._api_attr)
 
     def read(self, k8s: k8s_client.Kubernetes) -> Any:
         """reads the k8s object from the cluster, exception if not exists"""
@@ -119,7 +162,7 @@ class K8sModel(ABC):
             args: tuple = (self.name, DEFAULT_NAMESPACE)
         else:
             args = (self.name,)
-        return getattr(self.api(k8s), f"read{self.namespaced}_{self.API_FUNC}")(*args)
+        return getattr(self.api(k8s), self._read_name)(*args)
 
     def patch(
         self,
@@ -132,7 +175,7 @@ class K8sModel(ABC):
             args: tuple = (self.name, DEFAULT_NAMESPACE, self.get(k8s))
         else:
             args = (self.name, self.get(k8s))
-        return getattr(self.api(k8s), f"patch{self.namespaced}_{self.API_FUNC}")(
+        return getattr(self.api(k8s), self._patch_name)(
             *args, async_req=async_req, dry_run=dry_run.value
         )
 
@@ -147,6 +190,12 @@ class K8sModel(ABC):
         class RetryException(Exception):
             """Exception to Retry creation"""
 
+        # the spec is built once, retries resend the same object
+        if self.NAMESPACED:
+            args: tuple = (DEFAULT_NAMESPACE, self.get(k8s))
+        else:
+            args = (self.get(k8s),)
+
         @retry(
             retry=retry_if_exception_type(RetryException),
             stop=stop_after_attempt(10),
@@ -155,16 +204,12 @@ class K8sModel(ABC):
         )
         def _create() -> Any | ApplyResult:
             log.info("creating %s %s", _type := type(self).__name__, self.name)
-            if self.NAMESPACED:
-                args: tuple = (DEFAULT_NAMESPACE, self.get(k8s))
-            else:
-                args = (self.get(k8s),)
             try:
-                return getattr(
-                    self.api(k8s), f"create{self.namespaced}_{self.API_FUNC}"
-                )(*args, async_req=async_req, dry_run=dry_run.value)
+                return getattr(self.api(k8s), self._create_name)(
+                    *args, async_req=async_req, dry_run=dry_run.value
+                )
             except ApiException as ex:
-                if (ex_body := json.loads(ex.body)).get("reason") != "AlreadyExists":
+                if (ex_body := error_body(ex)).get("reason") != "AlreadyExists":
                     raise
                 if "object is being deleted" in ex_body.get("message"):
                     raise RetryException(
@@ -190,11 +235,11 @@ class K8sModel(ABC):
         else:
             args = (self.name,)
         try:
-            return getattr(self.api(k8s), f"delete{self.namespaced}_{self.API_FUNC}")(
+            return getattr(self.api(k8s), self._delete_name)(
                 *args, async_req=async_req, dry_run=dry_run.value
             )
         except ApiException as ex:
-            if json.loads(ex.body).get("reason") != "NotFound":
+            if error_body(ex).get("reason") != "NotFound":
                 raise
             log.info("%s %s do not exists, nothing to delete", _type, self.name)
         return None
@@ -226,22 +271,42 @@ class K8sModel(ABC):
                     break
                 time.sleep(1)
         except ApiException as ex:
-            if json.loads(ex.body).get("reason") != "NotFound":
+            if error_body(ex).get("reason") != "NotFound":
                 raise
             log.info("%s %s do not exists, creating", _type, self.name)
         return self.create(k8s, async_req, dry_run)
 
     def wait(self, k8s: k8s_client.Kubernetes) -> None:
         """waits until the k8s object exists"""
-        if self.NAMESPACED:
-            args: tuple = (DEFAULT_NAMESPACE,)
-        else:
-            args = tuple()
-        self._wait(
-            k8s=k8s,
-            func=getattr(self.api(k8s), f"list{self.namespaced}_{self.API_FUNC}"),
-            args=args,
-        )
+        # polls the object by name, there is no condition worth a watch stream
+        self._wait_exists(k8s)
+
+    @retry(
+        retry=retry_if_exception_type(HTTPError),
+        stop=stop_after_attempt(3),
+        wait=wait_fixed(1),
+        after=after_log(log, logger.logging.INFO),
+    )
+    def _wait_exists(self, k8s: k8s_client.Kubernetes) -> None:
+        """reads the object by name every second until it exists"""
+        msg = f"{type(self).__name__} {self.name}"
+        log.info("Waiting for %s to exist", msg)
+        timeout = time.time() + WAIT_TIMEOUT
+        while True:
+            try:
+                _object = self.read(k8s)
+            except ApiException as ex:
+                if error_body(ex).get("reason") != "NotFound":
+                    raise
+                if time.time() > timeout:
+                    raise RuntimeError(f"{msg} is not available yet") from ex
+                log.debug("%s do not exists yet", msg)
+                time.sleep(1)
+                continue
+            if getattr(getattr(_object, "status", None), "failed", 0):
+                raise RuntimeError(f"{msg} Failed!")
+            log.info("Done, object exists for %s ", msg)
+            return
 
     def _check_condition(
         self,
@@ -279,7 +344,7 @@ class K8sModel(ABC):
         wait=wait_fixed(1),
         after=after_log(log, logger.logging.INFO),
     )
-    def _wait(  # pylint: disable=too-many-branches # TODO refactor
+    def _wait(  # pylint: disable=too-many-locals
         self,
         k8s: k8s_client.Kubernetes,
         func: Callable,
@@ -296,70 +361,98 @@ class K8sModel(ABC):
         _phases = [p.value for p in phases] if phases else []
         field_selector = None if label_selector else f"metadata.name={self.name}"
         msg = f"{type(self).__name__} {self.name} with {condition=} {_phases=} {check_readiness=}"
-        log.info("Waiting for %s", msg)
-        for event in k8s.watch.stream(
-            func,
-            *args,
-            field_selector=field_selector,
-            label_selector=label_selector,
-            timeout_seconds=WAIT_TIMEOUT,
-            _request_timeout=80,
-        ):
-            current_conditions.clear()
+        # wait_for_items runs the waits concurrently, stopping a shared watch
+        # would end the other streams
+        watcher = k8s.new_watch()
+
+        # each check returns the log message when the wait is done
+        def _condition_met(event: dict) -> Optional[str]:
             if condition and self._check_condition(
                 current_conditions, condition, event
             ):
-                k8s.watch.stop()
-                log.info("Done, condition satisfied for %s ", msg)
-                return
-            if (
-                current_phase := getattr(
-                    status := event["object"].status, "phase", None
-                )
-            ) in _phases:  # pylint: disable=superfluous-parens
-                k8s.watch.stop()
-                log.info("Done, phase satisfied for %s ", msg)
-                return
-            if getattr(status, "failed", 0):
-                k8s.watch.stop()
+                return "Done, condition satisfied for %s "
+            return None
+
+        def _phase_met(_event: dict) -> Optional[str]:
+            if current_phase in _phases:
+                return "Done, phase satisfied for %s "
+            return None
+
+        def _raise_if_failed(event: dict) -> Optional[str]:
+            if getattr(event["object"].status, "failed", 0):
+                watcher.stop()
                 raise RuntimeError(f"{msg} Failed!")
-            if check_readiness and (
-                container_statuses := getattr(status, "container_statuses", [])
+            return None
+
+        def _readiness_met(event: dict) -> Optional[str]:
+            for container_status in (
+                getattr(event["object"].status, "container_statuses", None) or []
             ):
-                for container_status in container_statuses:
-                    if container_status.ready:
-                        k8s.watch.stop()
-                        log.info("Done, %s passed its readiness probe", msg)
-                        return
-            if check_replicas and isinstance(
+                if container_status.ready:
+                    return "Done, %s passed its readiness probe"
+            return None
+
+        def _replicas_met(event: dict) -> Optional[str]:
+            status = event["object"].status
+            if not isinstance(
                 status, (client.V1ReplicaSetStatus, client.V1StatefulSetStatus)
             ):
-                if status.replicas == status.available_replicas:
-                    k8s.watch.stop()
-                    log.info("Done, %s has all replicas available", msg)
-                    return
-                if status.available_replicas > 1 and status.ready_replicas > 1:
-                    k8s.watch.stop()
-                    log.info("Done, %s has enough replicas available", msg)
-                    return
-            if not condition and not _phases and not check_replicas:
-                k8s.watch.stop()
-                log.info("Done, object exists for %s ", msg)
-                return
+                return None
+            if status.replicas == status.available_replicas:
+                return "Done, %s has all replicas available"
+            if status.available_replicas > 1 and status.ready_replicas > 1:
+                return "Done, %s has enough replicas available"
+            return None
+
+        def _exists(_event: dict) -> Optional[str]:
+            return "Done, object exists for %s "
+
+        def _raise_if_pull_error(event: dict) -> Optional[str]:
             for pod in self._explore_object_pods(k8s, event):
-                if not pod.status.container_statuses:
-                    continue
-                for container_status in pod.status.container_statuses:
+                for container_status in pod.status.container_statuses or []:
                     if (
                         waiting_status := container_status.state.waiting
                     ) and waiting_status.reason in [
                         "ErrImagePull",
                         "ImagePullBackOff",
                     ]:
-                        k8s.watch.stop()
+                        watcher.stop()
                         raise K8SPullImageError(
                             f"{msg} Failed! Not possible to retrieve pod image ({waiting_status})"
                         )
+            return None
+
+        # only the checks that apply to the given arguments, in evaluation order
+        checks: List[Callable[[dict], Optional[str]]] = []
+        if condition:
+            checks.append(_condition_met)
+        if _phases:
+            checks.append(_phase_met)
+        checks.append(_raise_if_failed)
+        if check_readiness:
+            checks.append(_readiness_met)
+        if check_replicas:
+            checks.append(_replicas_met)
+        if not condition and not _phases and not check_replicas:
+            checks.append(_exists)
+        checks.append(_raise_if_pull_error)
+
+        log.info("Waiting for %s", msg)
+        for event in watcher.stream(
+            func,
+            *args,
+            field_selector=field_selector,
+            label_selector=label_selector,
+            timeout_seconds=WAIT_TIMEOUT,
+            _request_timeout=80,
+        ):
+            current_conditions.clear()
+            current_phase = getattr(event["object"].status, "phase", None)
+            for check in checks:
+                if done := check(event):
+                    watcher.stop()
+                    log.info(done, msg)
+                    return
             log.info(
                 "Still waiting for %s, last event: conditions[%s] phase[%s]",
                 msg,
@@ -552,7 +645,7 @@ class PersistentVolumeClaim(Volume):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PersistentVolumeClaimTemplate:
     """Persistent Volume Claim Template"""
 
@@ -569,14 +662,14 @@ class PersistentVolumeClaimTemplate:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeMount:
     """Mount a Volume in a pod folder and manage Persistent Volume Claim"""
 
     mount_path: str
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeMountPVC(VolumeMount):
     """Mount a Volume in a pod folder and manage Persistent Volume Claim"""
 
@@ -584,7 +677,7 @@ class VolumeMountPVC(VolumeMount):
     sub_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeMountPVCTemplate(VolumeMount):
     """Mount a Volume from a PVC template in a pod folder
     This is a volume use in stateful sets to automatically manage PVC and PV for the replicas
@@ -594,7 +687,7 @@ class VolumeMountPVCTemplate(VolumeMount):
     sub_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeMountConfigMap(VolumeMount):
     """Mount a Volume config map in a pod folder"""
 
@@ -602,7 +695,7 @@ class VolumeMountConfigMap(VolumeMount):
     default_mode: int
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeMountSecret(VolumeMount):
     """Mount a Secret in a pod folder"""
 
@@ -610,14 +703,14 @@ class VolumeMountSecret(VolumeMount):
     default_mode: int = 0o600
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeMountEmptyDir(VolumeMount):
     """Mount an EmptyDir Volume to share data between containers"""
 
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ServicePort:
     """Service Port"""
 
@@ -633,7 +726,7 @@ class ServicePort:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Port:
     """Generic port definition"""
 
@@ -660,7 +753,8 @@ class Service(K8sModel):
 
     def wait(self, k8s: k8s_client.Kubernetes) -> None:
         log.info("Waiting for service %s", self.name)
-        for event in k8s.watch.stream(
+        watcher = k8s.new_watch()
+        for event in watcher.stream(
             k8s.core_api.list_namespaced_endpoints,
             DEFAULT_NAMESPACE,
             field_selector=f"metadata.name={self.name}",
@@ -673,7 +767,7 @@ class Service(K8sModel):
                         f"Endpoint({address.ip} --> {address.target_ref.kind} {address.target_ref.name})"
                     )
             if details:
-                k8s.watch.stop()
+                watcher.stop()
                 log.info(
                     "Done, found endpoints for service %s : %s", self.name, details
                 )
@@ -855,16 +949,13 @@ class ServiceAccount(K8sModel):
 
     def get_role_binding(self, role: K8sRole) -> RoleBinding | ClusterRoleBinding:
         """Gets the service related to this Deployment"""
-        if len(name := f"sa-{self.name}-role-{role.name}") > 63:
-            if len(name := f"{self.name}-{role.name}") > 63:
-                raise ValueError(f"role binding name {name} is too long")
+        sa_name, role_name = self.name, role.name
+        name = role_binding_name(sa_name, role_name)
         if isinstance(role, ClusterRole):
             return ClusterRoleBinding(
-                name=name, service_account_name=self.name, role_name=role.name
+                name=name, service_account_name=sa_name, role_name=role_name
             )
-        return RoleBinding(
-            name=name, service_account_name=self.name, role_name=role.name
-        )
+        return RoleBinding(name=name, service_account_name=sa_name, role_name=role_name)
 
     def apply(
         self,
@@ -906,7 +997,7 @@ class WorkloadIdentity(ServiceAccount):
             )
             return self.read(k8s)
         except ApiException as ex:
-            if json.loads(ex.body).get("reason") == "NotFound":
+            if error_body(ex).get("reason") == "NotFound":
                 if dry_run == k8s_client.DryRun.ON:
                     log.error(
                         "Running apply with dry_run:ON, ignoring Workload Identity Not Found "
@@ -944,7 +1035,7 @@ class WorkloadIdentity(ServiceAccount):
         raise RuntimeError(f"{self.MSG}, delete is forbidden")
 
 
-@dataclass
+@dataclass(slots=True)
 class ValueFromField:
     """ValueFromField"""
 
@@ -957,7 +1048,7 @@ class ValueFromField:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ValueFromResourceField:
     """ValueFromResourceField"""
 
@@ -976,7 +1067,7 @@ class ValueFromResourceField:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Container:
     """Container definition"""
 
@@ -1307,7 +1398,7 @@ class Cronjob(Pod):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HPA:
     """HPA specification for ReplicaManager"""
 
@@ -1327,7 +1418,7 @@ class HPA:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class VerticalPodAutoscaler:
     """VerticalPodAutoscaler"""
 
@@ -1398,7 +1489,7 @@ class VerticalPodAutoscaler:
                 dry_run=dry_run.value,
             )
         except ApiException as ex:
-            if json.loads(ex.body).get("reason") == "NotFound":
+            if error_body(ex).get("reason") == "NotFound":
                 return k8s.custom_api.create_namespaced_custom_object(
                     group,
                     version,
@@ -1411,7 +1502,7 @@ class VerticalPodAutoscaler:
             raise
 
 
-@dataclass
+@dataclass(slots=True)
 class VPA:
     """VPA specification for ReplicaManager"""
 
@@ -1496,7 +1587,7 @@ class ReplicaManager(Pod, ABC):
     #         log.debug(f"{self.__class__.__name__} {self.name} already exists, patching it")
     #         replica_manager = super().patch(k8s, async_req, dry_run)
     #     except ApiException as ex:
-    #         if (reason := json.loads(ex.body).get("reason")) == "NotFound":
+    #         if (reason := error_body(ex).get("reason")) == "NotFound":
     #             replica_manager = super().create(k8s, async_req, dry_run)
     #         elif reason == "Invalid":
     #             replica_manager = super().apply(k8s, async_req, dry_run)
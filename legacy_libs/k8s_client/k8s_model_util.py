@@ -1,4 +1,5 @@
 import base64
+from concurrent import futures
 import json
 import os
 from typing import Any, Dict, List, Optional
@@ -49,13 +50,26 @@ def get_configmap_data_from_files(
 def wait_for_items(
     k8s: k8s_client.Kubernetes, dry_run: k8s_client.DryRun, items: List[Any]
 ) -> None:
-    """wait for each of the items in the list"""
-    for item in items:
-        if dry_run == k8s_client.DryRun.ON:
+    """wait for all the items in the list concurrently"""
+    if not items:
+        return
+    if dry_run == k8s_client.DryRun.ON:
+        for item in items:
             log.warning(
                 "Running on dry_run: Not waiting for %s %s",
                 type(item).__name__,
                 item.name,
             )
-            continue
-        item.wait(k8s)
+        return
+    # each wait is bound by the api server, run them in parallel
+    with futures.ThreadPoolExecutor(
+        max_workers=min(k8s_client.MAX_CONCURRENT_REQUESTS, len(items))
+    ) as executor:
+        pending = [executor.submit(item.wait, k8s) for item in items]
+        try:
+            for future in futures.as_completed(pending):
+                future.result()
+        except Exception:
+            # fail fast, the waits still queued are never started
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
@@ -1,6 +1,11 @@
+import asyncio
+from concurrent import futures
+from dataclasses import dataclass, field
 import json
 from multiprocessing.pool import ApplyResult
-from typing import Callable, Optional
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 from kubernetes.client.exceptions import ApiException
 
@@ -9,94 +14,216 @@ import logger
 from alerts.teams_client import alert
 from k8s_client import k8s_client
 from k8s_client.k8s_model import K8sModel
+from k8s_client.k8s_model_lib import error_body
 from k8s_client import constants as const
-from k8s_client.k8s_client import client
 from src.errors import K8sDeploymentError
 
 
 log = logger.get_logger(__name__)
 
+# max number of items per list request
+LIST_PAGE_SIZE = 500
+# seconds a list response can be reused during a deployment
+LIST_CACHE_TTL = 5.0
+
 
 def delete(
     name: str, _type: str, delete_func: Callable, dry_run: k8s_client.DryRun
 ) -> None:
     """delete and ignore NotFound errors"""
+    list_cache.invalidate(delete_func)
     try:
         log.warning("Deleting %s %s because is not specify in the model", _type, name)
         delete_func(name, const.DEFAULT_NAMESPACE, dry_run=dry_run.value)
     except ApiException as ex:
-        if json.loads(ex.body).get("reason") != "NotFound":
+        # NotFound is the common case, check the status before parsing the body
+        if ex.status != 404 and error_body(ex).get("reason") != "NotFound":
             raise
         log.info("%s %s do not exists, nothing to delete", _type, name)
 
 
+def list_all(list_func: Callable, **kwargs: Any) -> Iterator[dict]:
+    """iterate over all the items of a namespaced list, requesting them in pages
+
+    the items are the raw json dicts, this skips building the client models
+    when only a few fields (name, labels, owner references) are needed"""
+    _continue = None
+    while True:
+        response = list_func(
+            const.DEFAULT_NAMESPACE,
+            limit=LIST_PAGE_SIZE,
+            _continue=_continue,
+            _preload_content=False,
+            **kwargs,
+        )
+        data = json.loads(response.data)
+        yield from data.get("items") or []
+        if not (_continue := data["metadata"].get("continue")):
+            return
+
+
+@dataclass
+class ListCache:
+    """keeps list responses a few seconds, any deletion of the kind invalidates it
+
+    the lists and deletions run in threads, the lock guards the entries"""
+
+    ttl: float = LIST_CACHE_TTL
+    entries: dict[tuple, tuple[float, list[dict]]] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @staticmethod
+    def get_kind(api_func: Callable) -> str:
+        """list_namespaced_job and delete_namespaced_job share kind namespaced_job"""
+        return api_func.__name__.split("_", 1)[1]
+
+    def get_items(self, list_func: Callable, **kwargs: Any) -> list[dict]:
+        """get all the items of the list, from the cache if not expired"""
+        key = (self.get_kind(list_func), tuple(sorted(kwargs.items())))
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry and time.monotonic() - entry[0] < self.ttl:
+            return entry[1]
+        items = list(list_all(list_func, **kwargs))
+        with self.lock:
+            self.entries[key] = (time.monotonic(), items)
+        return items
+
+    def invalidate(self, api_func: Callable) -> None:
+        """remove all the cached lists of the kind modified by api_func"""
+        kind = self.get_kind(api_func)
+        with self.lock:
+            for key in [key for key in self.entries if key[0] == kind]:
+                del self.entries[key]
+
+    def clear(self) -> None:
+        """remove all the cached lists"""
+        with self.lock:
+            self.entries.clear()
+
+
+list_cache = ListCache()
+
+
+def delete_all(
+    deletions: list[tuple[str, str, Callable]], dry_run: k8s_client.DryRun
+) -> None:
+    """delete all the (name, type, delete_func) items concurrently"""
+    if not deletions:
+        return
+    with futures.ThreadPoolExecutor(
+        max_workers=k8s_client.MAX_CONCURRENT_REQUESTS
+    ) as executor:
+        pending = [
+            executor.submit(delete, name, _type, delete_func, dry_run)
+            for name, _type, delete_func in deletions
+        ]
+        try:
+            for future in futures.as_completed(pending):
+                future.result()
+        except Exception:
+            # fail fast, the deletions still queued are never started
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
 def delete_out_of_model(
-    k8s_model: K8sModel, k8s: k8s_client.Kubernetes, dry_run: k8s_client.DryRun
+    k8s_model: K8sModel,
+    k8s: k8s_client.Kubernetes,
+    dry_run: k8s_client.DryRun,
+    pod_keys: Optional[frozenset[str]] = None,
 ) -> None:
     """delete any deployment, cronjob or job that is not specified in the model"""
+    if pod_keys is None:
+        pod_keys = frozenset(k8s_model.all_pod_keys)
+    # request all the lists at once
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        cronjobs_req = executor.submit(
+            list_cache.get_items, k8s.batch_api.list_namespaced_cron_job
+        )
+        deployments_req = executor.submit(
+            list_cache.get_items, k8s.apps_api.list_namespaced_deployment
+        )
+        jobs_req = executor.submit(
+            list_cache.get_items, k8s.batch_api.list_namespaced_job
+        )
+        services_req = executor.submit(
+            list_cache.get_items, k8s.core_api.list_namespaced_service
+        )
+    deletions: list[tuple[str, str, Callable]] = []
     # Delete any cronjob not defined in the model
-    for cronjob in k8s.batch_api.list_namespaced_cron_job(
-        const.DEFAULT_NAMESPACE
-    ).items:
-        if (name := cronjob.metadata.name) not in k8s_model.all_pod_keys:
-            delete(name, "Cronjob", k8s.batch_api.delete_namespaced_cron_job, dry_run)
+    for cronjob in cronjobs_req.result():
+        if (name := cronjob["metadata"]["name"]) not in pod_keys:
+            deletions.append(
+                (name, "Cronjob", k8s.batch_api.delete_namespaced_cron_job)
+            )
     # delete any deployment not defined in the model
-    for deployment in k8s.apps_api.list_namespaced_deployment(
-        const.DEFAULT_NAMESPACE
-    ).items:
-        if (name := deployment.metadata.name) not in k8s_model.all_pod_keys:
+    orphan_deployments: set[str] = set()
+    for deployment in deployments_req.result():
+        if (name := deployment["metadata"]["name"]) not in pod_keys:
             if "postgresql" in name:
-                log.warning(f"Skipping deletion of old postgres deployment {name}")
+                log.warning("Skipping deletion of old postgres deployment %s", name)
                 continue
             if name.startswith("pg"):
                 log.warning(
-                    f"Skipping deletion of old distributed postgres deployment {name}"
+                    "Skipping deletion of old distributed postgres deployment %s", name
                 )
                 continue
-            delete(
-                name, "Deployment", k8s.apps_api.delete_namespaced_deployment, dry_run
+            deletions.append(
+                (name, "Deployment", k8s.apps_api.delete_namespaced_deployment)
+            )
+            orphan_deployments.add(name)
+    # one list for all the services, instead of a request per orphan deployment
+    for service in services_req.result():
+        if (name := service["metadata"]["name"]) in orphan_deployments:
+            deletions.append(
+                (name, "Deployment-Service", k8s.core_api.delete_namespaced_service)
             )
-            for service in k8s.core_api.list_namespaced_service(
-                const.DEFAULT_NAMESPACE, field_selector=f"metadata.name={name}"
-            ).items:
-                delete(
-                    service.metadata.name,
-                    "Deployment-Service",
-                    k8s.core_api.delete_namespaced_service,
-                    dry_run,
-                )
-
-    # delete any job not defined in the model
-    def is_in_model_job_owner_ref(job: client.V1Job) -> bool:
-        for owner_ref in job.metadata.owner_references or []:
-            if owner_ref.name in k8s_model.all_pod_keys:
-                return True
-        return False
 
-    for job in k8s.batch_api.list_namespaced_job(const.DEFAULT_NAMESPACE).items:
-        if (name := job.metadata.name) in k8s_model.all_pod_keys:
+    # delete any job not defined in the model (or owned by a model cronjob)
+    for job in jobs_req.result():
+        if (name := job["metadata"]["name"]) in pod_keys:
             continue
-        if is_in_model_job_owner_ref(job):
+        if any(
+            owner_ref["name"] in pod_keys
+            for owner_ref in job["metadata"].get("ownerReferences") or ()
+        ):
             continue
-        delete(name, "Job", k8s.batch_api.delete_namespaced_job, dry_run)
+        deletions.append((name, "Job", k8s.batch_api.delete_namespaced_job))
 
+    delete_all(deletions, dry_run)
 
-def clean_up_pods(k8s: k8s_client.Kubernetes, dry_run: k8s_client.DryRun) -> None:
-    """Clean up all the pods that are completed/error"""
-    for job in k8s.batch_api.list_namespaced_job(const.DEFAULT_NAMESPACE).items:
-        if job.metadata.labels.get("component") == const.TASKER_SCHEDULER_NAME:
-            delete(
-                job.metadata.name, "Job", k8s.batch_api.delete_namespaced_job, dry_run
-            )
-    for pod in k8s.core_api.list_namespaced_pod(const.DEFAULT_NAMESPACE).items:
-        if (phase := pod.status.phase) in [
-            k8s_client.PhasePod.FAILED.value,
-            k8s_client.PhasePod.SUCCEEDED.value,
-        ]:
-            log.info("deleting %s Pod %s", phase, name := pod.metadata.name)
+
+def clean_up_pods(
+    k8s: k8s_client.Kubernetes, dry_run: k8s_client.DryRun, only_tasker: bool = False
+) -> None:
+    """Clean up all the pods that are completed/error (or only the tasker ones)"""
+    # let the api server filter, instead of listing everything in the namespace
+    tasker_selector = f"component={const.TASKER_SCHEDULER_NAME}"
+    for job in list_cache.get_items(
+        k8s.batch_api.list_namespaced_job, label_selector=tasker_selector
+    ):
+        delete(
+            job["metadata"]["name"], "Job", k8s.batch_api.delete_namespaced_job, dry_run
+        )
+    deleted_pods: set[str] = set()
+    phases = (
+        ()
+        if only_tasker
+        else (k8s_client.PhasePod.FAILED.value, k8s_client.PhasePod.SUCCEEDED.value)
+    )
+    for phase in phases:
+        for pod in list_cache.get_items(
+            k8s.core_api.list_namespaced_pod, field_selector=f"status.phase={phase}"
+        ):
+            log.info("deleting %s Pod %s", phase, name := pod["metadata"]["name"])
             delete(name, "Pod", k8s.core_api.delete_namespaced_pod, dry_run)
-        elif pod.metadata.labels.get("component") == const.TASKER_SCHEDULER_NAME:
-            log.info("deleting tasker Pod %s", name := pod.metadata.name)
+            deleted_pods.add(name)
+    for pod in list_cache.get_items(
+        k8s.core_api.list_namespaced_pod, label_selector=tasker_selector
+    ):
+        if (name := pod["metadata"]["name"]) not in deleted_pods:
+            log.info("deleting tasker Pod %s", name)
             delete(name, "Pod", k8s.core_api.delete_namespaced_pod, dry_run)
 
 
@@ -111,9 +238,12 @@ def canary_test(k8s: k8s_client.Kubernetes, dry_run: k8s_client.DryRun) -> None:
             f"Aborting GKE deployment, canary job:{canary_name} failed"
         ) from ex
     finally:
-        for job in k8s.batch_api.list_namespaced_job(const.DEFAULT_NAMESPACE).items:
-            if (name := job.metadata.name) == canary_name:
-                delete(name, "Job", k8s.batch_api.delete_namespaced_job, dry_run)
+        for job in k8s.batch_api.list_namespaced_job(
+            const.DEFAULT_NAMESPACE, field_selector=f"metadata.name={canary_name}"
+        ).items:
+            delete(
+                job.metadata.name, "Job", k8s.batch_api.delete_namespaced_job, dry_run
+            )
         for pod in k8s.core_api.list_namespaced_pod(
             const.DEFAULT_NAMESPACE, label_selector=f"job-name={canary_name}"
         ).items:
@@ -122,6 +252,57 @@ def canary_test(k8s: k8s_client.Kubernetes, dry_run: k8s_client.DryRun) -> None:
             )
 
 
+async def apply_all(
+    items: Iterable[Any],
+    k8s: k8s_client.Kubernetes,
+    dry_run: k8s_client.DryRun,
+    async_req: bool = False,
+) -> list[Any]:
+    """apply all the items concurrently, the results keep the order of the items"""
+    # apply reads, deletes and waits for the deletion before creating the object
+    # running them in threads overlaps those blocking calls between items
+    # the semaphore avoids the api server throttling (429 Too Many Requests)
+    semaphore = asyncio.Semaphore(k8s_client.MAX_CONCURRENT_REQUESTS)
+
+    async def apply(item: Any) -> Any:
+        async with semaphore:
+            return await asyncio.to_thread(
+                item.apply, k8s, async_req=async_req, dry_run=dry_run
+            )
+
+    try:
+        return await asyncio.gather(*(apply(item) for item in items))
+    finally:
+        # the applied objects (and the pods they start) are not in the cached lists
+        list_cache.clear()
+
+
+def get_result(result: Any) -> Any:
+    """get the response of an async call to the k8s api"""
+    if isinstance(result, ApplyResult):
+        log.info("waiting for async call to k8s api %s", result)
+        return result.get(timeout=30)
+    return result
+
+
+def wait_for_results(results: list[Any]) -> None:
+    """wait for all the async responses, logging each one as soon as it completes"""
+    if not results:
+        return
+    with futures.ThreadPoolExecutor(
+        max_workers=min(k8s_client.MAX_CONCURRENT_REQUESTS, len(results))
+    ) as executor:
+        pending = [executor.submit(get_result, result) for result in results]
+        for future in futures.as_completed(pending):
+            result = future.result()
+            if hasattr(result, "kind") and hasattr(result, "metadata"):
+                log.info(
+                    "K8s object %s %s created",
+                    result.kind,
+                    getattr(result.metadata, "name", "n/a"),
+                )
+
+
 def test_deploy(docker_image: str, kubeconfig: Optional[dict] = None) -> None:
     """Test the deployment to kubernetes"""
     del docker_image  # why? just to have image in the alert
@@ -139,9 +320,15 @@ def deploy(
     k8s: k8s_client.Kubernetes, dry_run: k8s_client.DryRun = k8s_client.DryRun.OFF
 ) -> None:
     """deploys to the kubernetes cluster"""
+    list_cache.clear()
     # disable cronjobs, so nothing unexpected run during deployment
     # parallel jobs are not killed (can still try to finish)
     k8s_model = K8sModel()
+    # the model properties are computed on each access, read them only once
+    pod_keys = frozenset(k8s_model.all_pod_keys)
+    maps = tuple(k8s_model.maps)
+    service_accounts = tuple(k8s_model.service_accounts)
+    pods = tuple(k8s_model.pods)
     # before deploying, check the status of the databases in the cluster
     # during deployment other processes may be stopped, and the dbs cpu/mem consumption decrease
     cluster_resources = k8s.get_cluster_resources(
@@ -159,34 +346,24 @@ def deploy(
         dry_run,
     )
     try:
-        delete_out_of_model(k8s_model, k8s, dry_run)
+        delete_out_of_model(k8s_model, k8s, dry_run, pod_keys)
         clean_up_pods(k8s, dry_run)
         # apply all the configmaps and secrets
-        for _k8s_map in k8s_model.maps:
-            _k8s_map.apply(k8s, dry_run=dry_run)
+        asyncio.run(apply_all(maps, k8s, dry_run))
         # after configmaps and secrets, delete again any pod that could have been created
         # that ensure that any new pod will run with the new image
-        clean_up_pods(k8s, dry_run)
+        # (cronjobs are disabled, only the tasker scheduler could have created new pods)
+        # those pods are newer than any cached list, request them again
+        list_cache.clear()
+        clean_up_pods(k8s, dry_run, only_tasker=True)
         k8s_model.deploy_volumes(k8s, dry_run)
         # create service accounts
-        for service_account in k8s_model.service_accounts:
-            service_account.apply(k8s, dry_run=dry_run)
+        asyncio.run(apply_all(service_accounts, k8s, dry_run))
         k8s_model.deploy_databases(k8s, dry_run, cluster_resources)
         # create all the other pods
-        results = []
-        for pod in k8s_model.pods:
-            results.append(pod.apply(k8s, async_req=True, dry_run=dry_run))
+        results = asyncio.run(apply_all(pods, k8s, dry_run, async_req=True))
         # wait for request response of all the pods
-        for result in results:
-            if isinstance(result, ApplyResult):
-                log.info("waiting for async call to k8s api %s", result)
-                result = result.get(timeout=30)
-            if hasattr(result, "kind") and hasattr(result, "metadata"):
-                log.info(
-                    "K8s object %s %s created",
-                    result.kind,
-                    getattr(result.metadata, "name", "n/a"),
-                )
+        wait_for_results(results)
     finally:
         k8s.enable_all_cronjobs(const.DEFAULT_NAMESPACE, dry_run=dry_run)
     log.info("deployment completed")
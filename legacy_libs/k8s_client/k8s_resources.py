@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, overload, Union
 
 from kubernetes import client
@@ -50,10 +51,12 @@ class PodResources:
 
     def to_quantity_dict(self) -> dict[str, Optional[float]]:
         """creates a dict from a PodResources object containing the quantity in k"""
+        # quantities are already parsed on __post_init__, returns a new dict (mutable)
+        _resources = object.__getattribute__(self, "_resources")
         return {
-            k.replace("_", "-"): float(parse_quantity(v)) if v else None
-            for k, v in self.__dict__.items()
-            if k in ["memory", "cpu", "ephemeral_storage"]
+            "memory": _resources.get("memory"),
+            "cpu": _resources.get("cpu"),
+            "ephemeral-storage": _resources.get("ephemeral_storage"),
         }
 
     def __post_init__(self) -> None:
@@ -338,11 +341,37 @@ class ClusterResources:
         """returns a list of pods"""
         return list(self.pods_map.values())
 
+    @cached_property
+    def requested_quantities_by_container(self) -> dict[str, dict[str, list[float]]]:
+        """returns the requested quantities of all the pods by container name and resource"""
+        by_container: dict[str, dict[str, list[float]]] = {}
+        for pod in self.pods_map.values():
+            for container_name, container in pod.containers.items():
+                container_quantities = by_container.setdefault(container_name, {})
+                requested_dict = container.requested_resources.to_quantity_dict()
+                for quantity, requested in requested_dict.items():
+                    if requested:
+                        container_quantities.setdefault(quantity, []).append(requested)
+        return by_container
+
+    @cached_property
+    def pods_by_name(self) -> dict[str, PodResourcesData]:
+        """returns the pods indexed by its pod_name label (first pod found by name)"""
+        pods_by_name: dict[str, PodResourcesData] = {}
+        for pod in self.pods_map.values():
+            if (pod_name := (pod.labels or {}).get("pod_name")) is not None:
+                pods_by_name.setdefault(pod_name, pod)
+        return pods_by_name
+
+    @cached_property
+    def allocatable_quantity_dict(self) -> dict[str, Optional[float]]:
+        """returns the total allocatable resources of the cluster as a quantity dict"""
+        return self.total_allocatable.to_quantity_dict()
+
     def get_pod(self, pod_name: str) -> PodResourcesData | None:
         """returns a pod by name"""
-        for pod in self.pods:
-            if pod.labels["pod_name"] == pod_name:
-                return pod
+        if pod := self.pods_by_name.get(pod_name):
+            return pod
         for pod_id in self.pods_map:
             if pod_id.startswith(pod_name):
                 return self.pods_map[pod_id]
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional
 
 from k8s_client import k8s_resources, constants as const
@@ -6,6 +7,16 @@ import logger
 
 log = logger.get_logger(__name__)
 
+MAX_EPHEMERAL_STORAGE_QUANTITY = float(
+    k8s_resources.parse_quantity(const.MAX_EPHEMERAL_STORAGE)
+)
+
+
+@lru_cache(maxsize=64)
+def parse_quantity(quantity: str) -> float:
+    """parse a k8s quantity string (compute class limits are parsed only once)"""
+    return float(k8s_resources.parse_quantity(quantity))
+
 
 def get_container_in_cluster(
     pod: Pod,
@@ -32,7 +43,9 @@ def increase_container_resources_if_necessary(
         used_quantity = usage_quantities[quantity]
         if not requested_quantity or not used_quantity:
             log.warning(
-                f"Not enough information to calculate usage for {quantity=} {container.container_name=}"
+                "Not enough information to calculate usage for quantity=%r container.container_name=%r",
+                quantity,
+                container.container_name,
             )
             continue
         usage = used_quantity / requested_quantity
@@ -41,8 +54,14 @@ def increase_container_resources_if_necessary(
                 max(used_quantity, requested_quantity) * increase_factor
             )
             log.info(
-                f"Increasing {container.container_name=} resource {quantity} ({used_quantity=} {requested_quantity=}) "
-                f"by factor {increase_factor} to {increased_quantities[quantity]}"
+                "Increasing container.container_name=%r resource %s (used_quantity=%r requested_quantity=%r) "
+                "by factor %s to %s",
+                container.container_name,
+                quantity,
+                used_quantity,
+                requested_quantity,
+                increase_factor,
+                increased_quantities[quantity],
             )
     return increased_quantities
 
@@ -52,28 +71,14 @@ def calculate_container_average_resources(
     cluster_resources: k8s_resources.ClusterResources,
 ) -> dict[str, Optional[float]]:
     """will calculate the average used resources of existing pods in the cluster wtih same name"""
-    log.info(f"Calculating average resources for {container.name=}")
-    sum_quantities: dict[str, float] = {}
-    count_quantities: dict[str, int] = {}
-    for pod_in_cluster in cluster_resources.pods_map.values():
-        if container.name not in pod_in_cluster.containers:
-            continue
-        log.info(
-            f"considering existing pod {pod_in_cluster.pod_name} resources on average calculation"
-        )
-        requested_quantities = pod_in_cluster.containers[
-            container.name
-        ].requested_resources.to_quantity_dict()
-        for quantity, requested_quantity in list(requested_quantities.items()):
-            if not requested_quantity:
-                continue
-            sum_quantities[quantity] = (
-                sum_quantities.get(quantity, 0) + requested_quantity
-            )
-            count_quantities[quantity] = count_quantities.get(quantity, 0) + 1
+    log.info("Calculating average resources for container.name=%r", container.name)
+    # the requested quantities are grouped once per cluster scan, not per container
+    requested_quantities = cluster_resources.requested_quantities_by_container.get(
+        container.name, {}
+    )
     return {
-        quantity: total / count_quantities[quantity]
-        for quantity, total in sum_quantities.items()
+        quantity: sum(requested) / len(requested)
+        for quantity, requested in requested_quantities.items()
     }
 
 
@@ -93,13 +98,18 @@ def increase_pod_resources_if_necessary(
     return True if the pod resources were increased, False otherwise
     """
     any_change = False
+    # the limits do not change between containers, compute them once
+    max_allocatable_quantities = get_max_allocatable_quantities(
+        cluster_resources, max_cluster_allocatable_threshold
+    )
+    max_pod_quantities = get_max_pod_quantities(compute_class)
     for container in pod.containers:
         quantities_to_apply = {}
         if container_in_cluster := get_container_in_cluster(
             pod, container.name, cluster_resources
         ):
             log.info(
-                f"Existing Pod {pod.name} checking if resources need to be increased"
+                "Existing Pod %s checking if resources need to be increased", pod.name
             )
             # update pod resources with current requested resources
             pod.container_map[
@@ -113,7 +123,9 @@ def increase_pod_resources_if_necessary(
             )
             if not increased_quantities:
                 log.info(
-                    f"Pod {pod.name} container {container_in_cluster.container_name} resources are within limits"
+                    "Pod %s container %s resources are within limits",
+                    pod.name,
+                    container_in_cluster.container_name,
                 )
                 continue
             requested_quantities = (
@@ -123,84 +135,163 @@ def increase_pod_resources_if_necessary(
             quantities_to_apply = requested_quantities
         elif cluster_resources.pods_map:
             log.info(
-                f"New {pod.name=} {container.name} will be initialized with the average of the other data nodes"
+                "New pod.name=%r %s will be initialized with the average of the other data nodes",
+                pod.name,
+                container.name,
             )
             if quantities_to_apply := calculate_container_average_resources(
                 container, cluster_resources
             ):
                 log.info(
-                    f"Initializing pod {pod.name} with resource request {quantities_to_apply=}"
+                    "Initializing pod %s with resource request quantities_to_apply=%r",
+                    pod.name,
+                    quantities_to_apply,
                 )
         if quantities_to_apply:
             # An increase it's necessary, update the pod resources within limits (cluster resources and compute class)
-            request_resource = apply_all_filters(
-                k8s_resources.PodResources.from_quantity_dict(quantities_to_apply),
-                compute_class=compute_class,
-                cluster_resources=cluster_resources,
-                max_cluster_allocatable_threshold=max_cluster_allocatable_threshold,
+            request_resource = k8s_resources.PodResources.from_quantity_dict(
+                apply_quantity_filters(
+                    quantities_to_apply,
+                    compute_class,
+                    max_allocatable_quantities,
+                    max_pod_quantities,
+                )
             )
             pod.container_map[container.name].resources = request_resource
             any_change = True
     return any_change
 
 
-def apply_all_filters(
-    request_resource: k8s_resources.PodResources,
-    compute_class: const.ComputeClassLimits,
+def get_max_allocatable_quantities(
     cluster_resources: k8s_resources.ClusterResources,
-    max_cluster_allocatable_threshold: float,
-) -> k8s_resources.PodResources:
-    """modify the required resources to comply with the compute class cpu/mem ratios and cluster max allocatable limit"""
-    request_resource = apply_cpu_mem_ratios(
-        request_resource, compute_class=compute_class
-    )
-    request_resource = apply_cluster_max_allocatable_limit(
-        request_resource,
-        cluster_resources,
-        max_allocatable_threshold=max_cluster_allocatable_threshold,
-    )
-    request_resource = apply_pod_limits(request_resource, compute_class=compute_class)
-    return request_resource
+    max_allocatable_threshold: float,
+) -> dict[str, Optional[float]]:
+    """get the max quantities a pod can request based on the cluster allocatable resources"""
+    return {
+        resource: quantity * max_allocatable_threshold if quantity else quantity
+        for resource, quantity in cluster_resources.allocatable_quantity_dict.items()
+    }
 
 
-def apply_cpu_mem_ratios(
-    required_resources: k8s_resources.PodResources,
+def get_max_pod_quantities(
     compute_class: const.ComputeClassLimits,
-) -> k8s_resources.PodResources:
-    """modify the required resources to comply with the compute class cpu/mem ratios"""
-    if required_resources == k8s_resources.PodResources():
+) -> dict[str, float]:
+    """get the max quantities a pod can request based on the compute class"""
+    return {
+        "cpu": parse_quantity(compute_class.max_cpu),
+        "memory": parse_quantity(compute_class.max_memory),
+        "ephemeral-storage": MAX_EPHEMERAL_STORAGE_QUANTITY,
+    }
+
+
+def apply_quantity_filters(
+    quantities: dict[str, Optional[float]],
+    compute_class: const.ComputeClassLimits,
+    max_allocatable_quantities: dict[str, Optional[float]],
+    max_pod_quantities: dict[str, float],
+) -> dict[str, Optional[float]]:
+    """
+    modify the quantities to comply with the compute class cpu/mem ratios,
+    the cluster max allocatable limit and the pod limits, in a single pass over the quantities
+    """
+    quantities = _apply_cpu_mem_ratios(dict(quantities), compute_class)
+    _trim_quantities(quantities, max_allocatable_quantities, "cluster max allocatable")
+    _trim_quantities(quantities, max_pod_quantities, "pod limits")
+    return quantities
+
+
+def _apply_cpu_mem_ratios(
+    quantities: dict[str, Optional[float]],
+    compute_class: const.ComputeClassLimits,
+) -> dict[str, Optional[float]]:
+    """modify the quantities (in place) to comply with the compute class cpu/mem ratios"""
+    if not any(quantities.values()):
         log.debug(
-            f"requesting minimum resources, no necessary to apply {compute_class=} cpu/mem ratios"
+            "requesting minimum resources, no necessary to apply compute_class=%r cpu/mem ratios",
+            compute_class,
         )
-        return required_resources
+        return quantities
     # apply compute class minimuls to null values
-    if not required_resources.cpu or not required_resources.memory:
+    if not quantities.get("cpu") or not quantities.get("memory"):
         log.warning(
-            f"cpu or mem missing on  {required_resources=} applying {compute_class=} min values"
+            "cpu or mem missing on quantities=%r applying compute_class=%r min values",
+            quantities,
+            compute_class,
         )
-        required_resources = k8s_resources.PodResources(
-            cpu=required_resources.cpu or compute_class.min_cpu,
-            memory=required_resources.memory or compute_class.min_memory,
-            ephemeral_storage=required_resources.ephemeral_storage,
-        )
-    required_ratio = required_resources.get_cpu_memory_ratio()
-    resource_dict = required_resources.to_quantity_dict()
+        if not quantities.get("cpu"):
+            quantities["cpu"] = parse_quantity(compute_class.min_cpu)
+        if not quantities.get("memory"):
+            quantities["memory"] = parse_quantity(compute_class.min_memory)
+    # CPU:memory ratio (vCPU:GiB)
+    memory, cpu = quantities["memory"], quantities["cpu"]
+    required_ratio = memory / 1073741824 / cpu  # type: ignore
     if required_ratio > compute_class.max_cpu_memory_ratio:
-        msg = f"{required_resources=} cpu/mem ratio {required_ratio} excess {compute_class=}."
         required_increase = required_ratio / compute_class.max_cpu_memory_ratio
         resource = "cpu"
     elif required_ratio < compute_class.min_cpu_memory_ratio:
-        msg = f"{required_resources=} cpu/mem ratio {required_ratio} below {compute_class=}."
+        log.warning(
+            "quantities=%r cpu/mem ratio %s below compute_class=%r.",
+            quantities,
+            required_ratio,
+            compute_class,
+        )
         required_increase = compute_class.min_cpu_memory_ratio / required_ratio
         resource = "memory"
-        log.warning(msg)
     else:
         log.info(
-            f"{required_resources=} cpu/mem ratio {required_ratio} within {compute_class=}."
+            "quantities=%r cpu/mem ratio %s within compute_class=%r.",
+            quantities,
+            required_ratio,
+            compute_class,
         )
-        return required_resources
-    resource_dict[resource] *= required_increase  # type: ignore
-    return k8s_resources.PodResources.from_quantity_dict(resource_dict)
+        return quantities
+    quantities[resource] *= required_increase  # type: ignore
+    return quantities
+
+
+def _trim_quantities(
+    quantities: dict[str, Optional[float]],
+    max_quantities: dict[str, Optional[float]] | dict[str, float],
+    limit_name: str,
+) -> None:
+    """trim (in place) the quantities that exceed the max quantities"""
+    msg: list[str] = []
+    for resource, quantity in quantities.items():
+        max_quantity = max_quantities.get(resource)
+        if quantity and max_quantity and quantity > max_quantity:
+            msg.append(f"{resource=} {quantity=} exceed {limit_name} {max_quantity=}")
+            quantities[resource] = max_quantity
+    if msg:
+        log.warning(", ".join(msg) + ".")
+
+
+def apply_all_filters(
+    request_resource: k8s_resources.PodResources,
+    compute_class: const.ComputeClassLimits,
+    cluster_resources: k8s_resources.ClusterResources,
+    max_cluster_allocatable_threshold: float,
+) -> k8s_resources.PodResources:
+    """modify the required resources to comply with the compute class cpu/mem ratios and cluster max allocatable limit"""
+    return k8s_resources.PodResources.from_quantity_dict(
+        apply_quantity_filters(
+            request_resource.to_quantity_dict(),
+            compute_class,
+            get_max_allocatable_quantities(
+                cluster_resources, max_cluster_allocatable_threshold
+            ),
+            get_max_pod_quantities(compute_class),
+        )
+    )
+
+
+def apply_cpu_mem_ratios(
+    required_resources: k8s_resources.PodResources,
+    compute_class: const.ComputeClassLimits,
+) -> k8s_resources.PodResources:
+    """modify the required resources to comply with the compute class cpu/mem ratios"""
+    return k8s_resources.PodResources.from_quantity_dict(
+        _apply_cpu_mem_ratios(required_resources.to_quantity_dict(), compute_class)
+    )
 
 
 def apply_cluster_max_allocatable_limit(
@@ -210,19 +301,12 @@ def apply_cluster_max_allocatable_limit(
 ) -> k8s_resources.PodResources:
     """modify the required resources to comply with the cluster max allocatable limit"""
     required_dict = required_resources.to_quantity_dict()
-    max_allocatable = cluster_resources.total_allocatable * max_allocatable_threshold
-    max_allocatable_dict = max_allocatable.to_quantity_dict()
-    msg: list[str] = []
-    for resource, quantity in required_dict.items():
-        if quantity and quantity > (max_allocatable_dict.get(resource) or quantity):
-            msg.append(
-                f"{resource=} {quantity=} exceed {max_allocatable_dict[resource]=}"
-            )
-            required_dict[resource] = max_allocatable_dict[resource]
-    if msg:
-        log.warning(", ".join(msg) + f" for {required_resources=}.")
-        return k8s_resources.PodResources.from_quantity_dict(required_dict)
-    return required_resources
+    _trim_quantities(
+        required_dict,
+        get_max_allocatable_quantities(cluster_resources, max_allocatable_threshold),
+        "cluster max allocatable",
+    )
+    return k8s_resources.PodResources.from_quantity_dict(required_dict)
 
 
 def apply_pod_limits(
@@ -230,23 +314,6 @@ def apply_pod_limits(
     compute_class: const.ComputeClassLimits,
 ) -> k8s_resources.PodResources:
     """modify the required resources to comply with the pod limits"""
-    max_pod_resources = {
-        "cpu": float(k8s_resources.parse_quantity(compute_class.max_cpu)),
-        "memory": float(k8s_resources.parse_quantity(compute_class.max_memory)),
-        "ephemeral-storage": float(
-            k8s_resources.parse_quantity(const.MAX_EPHEMERAL_STORAGE)
-        ),
-    }
-    trimmed_quantities = {}
-    for resource, quantity in required_resources.to_quantity_dict().items():
-        max_quantity = max_pod_resources[resource]
-        if quantity and quantity > max_quantity:
-            trimmed_quantities[resource] = max_quantity
-    if trimmed_quantities:
-        requested_quantities = required_resources.to_quantity_dict()
-        requested_quantities.update(trimmed_quantities)
-        log.warning(
-            f"{required_resources=} exceed {max_pod_resources=} trimmed to {requested_quantities=}"
-        )
-        return k8s_resources.PodResources.from_quantity_dict(requested_quantities)
-    return required_resources
+    required_dict = required_resources.to_quantity_dict()
+    _trim_quantities(required_dict, get_max_pod_quantities(compute_class), "pod limits")
+    return k8s_resources.PodResources.from_quantity_dict(required_dict)
@@ -7,17 +7,14 @@ from rich.rule import Rule
 from rich.table import Table
 
 from piceli.k8s.cli import common
-from piceli.k8s.exceptions import api_exceptions
-from piceli.k8s.k8s_client.client import ClientContext
-from piceli.k8s.object_manager.factory import ManagerFactory, ObjectManager
-from piceli.k8s.ops import loader
-from piceli.k8s.ops.compare import object_comparer
 
 if TYPE_CHECKING:
     from piceli.k8s.cli.context import ContextObject
+    from piceli.k8s.object_manager.factory import ObjectManager
+    from piceli.k8s.ops.compare import object_comparer
 
 
-def print_new_objects(console: Console, new_objects: list[ObjectManager]) -> None:
+def print_new_objects(console: Console, new_objects: list["ObjectManager"]) -> None:
     """Prints a table listing all new Kubernetes objects that will be created."""
     if new_objects:
         table = Table(
@@ -40,8 +37,8 @@ def print_new_objects(console: Console, new_objects: list[ObjectManager]) -> Non
 
 
 class ObjCompareResult(NamedTuple):
-    desired_obj: ObjectManager
-    compared_result: object_comparer.CompareResult
+    desired_obj: "ObjectManager"
+    compared_result: "object_comparer.CompareResult"
 
 
 def print_summary_of_changes(
@@ -107,7 +104,7 @@ def print_differences(console: Console, obj_compare_result: ObjCompareResult) ->
 
     # Helper function to add differences to the table, with color coding for type
     def add_differences_to_table(
-        diff_type: str, differences: list[object_comparer.PathComparison], color: str
+        diff_type: str, differences: list["object_comparer.PathComparison"], color: str
     ) -> None:
         for diff in differences:
             # Convert complex structures to JSON strings for better readability
@@ -178,6 +175,12 @@ def detail(
     ctx_obj: "ContextObject" = ctx.obj
     common.print_ctx_options(console, ctx_obj)
 
+    from piceli.k8s.exceptions import api_exceptions
+    from piceli.k8s.k8s_client.client import ClientContext
+    from piceli.k8s.object_manager.factory import ManagerFactory
+    from piceli.k8s.ops import loader
+    from piceli.k8s.ops.compare import object_comparer
+
     k8s_objects = loader.load_all(
         module_name=ctx_obj.module_name,
         module_path=ctx_obj.module_path,
@@ -5,8 +5,6 @@ from rich.console import Console
 from rich.tree import Tree
 
 from piceli.k8s.cli import common
-from piceli.k8s.ops import loader
-from piceli.k8s.ops.deploy import strategy_auto
 
 if TYPE_CHECKING:
     from piceli.k8s.cli.context import ContextObject
@@ -31,6 +29,9 @@ def plan(
     ctx_obj: "ContextObject" = ctx.obj
     common.print_ctx_options(console, ctx_obj)
 
+    from piceli.k8s.ops import loader
+    from piceli.k8s.ops.deploy import strategy_auto
+
     strategy = strategy_auto.StrategyAuto()
     k8s_objects = loader.load_all(
         module_name=ctx_obj.module_name,
@@ -1,21 +1,19 @@
 import asyncio
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, Iterable
 
 import typer
-from kubernetes.client.exceptions import ApiException
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress
 
 from piceli.k8s.cli import common
-from piceli.k8s.cli.deploy import progress
-from piceli.k8s.exceptions import api_exceptions
-from piceli.k8s.k8s_client.client import ClientContext
-from piceli.k8s.ops import loader
-from piceli.k8s.ops.deploy import deployment_executor, strategy_auto
 
 if TYPE_CHECKING:
     from piceli.k8s.cli.context import ContextObject
+    from piceli.k8s.exceptions import api_exceptions
+    from piceli.k8s.k8s_client.client import ClientContext
+    from piceli.k8s.k8s_objects.base import K8sObject
+    from piceli.k8s.ops.deploy import deployment_executor, deployment_graph
 
 
 def run(
@@ -35,87 +33,152 @@ def run(
     """Deploy Kubernetes Object Model to the current cluster."""
     console = Console()
     common.print_command_name(console, "Running Deployment")
+    # the kubernetes client and the ops are only imported when the command runs
+    from piceli.k8s.k8s_client.client import ClientContext
+    from piceli.k8s.ops import loader
+
     ctx_obj: "ContextObject" = ctx.obj
-    strategy = strategy_auto.StrategyAuto()
     k8s_objects = loader.load_all(
         module_name=ctx_obj.module_name,
         module_path=ctx_obj.module_path,
         folder_path=ctx_obj.folder_path,
         sub_elements=ctx_obj.sub_elements,
     )
+    client_ctx = ClientContext()
+    asyncio.run(
+        _prepare_and_run(
+            console, k8s_objects, ctx_obj.namespace, client_ctx, create_namespace
+        )
+    )
+
+
+def _build_deployment_graph(
+    k8s_objects: Iterable["K8sObject"],
+) -> "deployment_graph.DeploymentGraph":
+    from piceli.k8s.ops.deploy import strategy_auto
+
+    strategy = strategy_auto.StrategyAuto()
     deploy_graph = strategy.build_deployment_graph(k8s_objects)
     deploy_graph.validate()
-    executor = deployment_executor.DeploymentExecutor(deploy_graph)
+    return deploy_graph
+
+
+async def _prepare_and_run(
+    console: Console,
+    k8s_objects: Iterable["K8sObject"],
+    namespace: str,
+    client_ctx: "ClientContext",
+    create_namespace: bool,
+) -> None:
+    from piceli.k8s.ops.deploy import deployment_executor
+
+    # the graph build is independent of the client setup, overlap them
+    deploy_graph, _ = await asyncio.gather(
+        asyncio.to_thread(_build_deployment_graph, k8s_objects),
+        asyncio.to_thread(_load_api_client, client_ctx),
+    )
+    # only modify the cluster once the graph is valid
     if create_namespace:
-        _upsert_namespace(console, ctx_obj.namespace)
-    asyncio.run(run_deployment(console, executor, ctx_obj.namespace))
+        await asyncio.to_thread(_upsert_namespace, console, namespace, client_ctx)
+    executor = deployment_executor.DeploymentExecutor(deploy_graph)
+    await run_deployment(console, executor, namespace, client_ctx)
+
 
+def _load_api_client(client_ctx: "ClientContext") -> None:
+    # loads the kube config and creates the pooled client before the deployment
+    _ = client_ctx.api_client
+
+
+def _upsert_namespace(
+    console: Console, namespace_name: str, client_ctx: "ClientContext"
+) -> None:
+    from kubernetes.client.exceptions import ApiException
+
+    from piceli.k8s.exceptions import api_exceptions
 
-def _upsert_namespace(console: Console, namespace_name: str) -> None:
     body = {"metadata": {"name": namespace_name}}
-    client_ctx = ClientContext()
     try:
-        client_ctx.core_api.read_namespace(name=namespace_name)
+        client_ctx.core_api.create_namespace(body=body)
+        console.print(f"[green]Namespace '{namespace_name}' created successfully.[/]")
+    except ApiException as ex:
+        api_op_ex = api_exceptions.ApiOperationException.from_api_exception(ex)
+        if api_op_ex.forbidden:
+            # users with rbac limited to the namespace can read it, but not create it
+            _read_namespace(console, namespace_name, client_ctx, api_op_ex)
+            return
+        if not api_op_ex.already_exists:
+            raise api_op_ex from ex
         console.print(
             f"[yellow]Namespace '{namespace_name}' already exists. No action required.[/]"
         )
+
+
+def _read_namespace(
+    console: Console,
+    namespace_name: str,
+    client_ctx: "ClientContext",
+    create_ex: "api_exceptions.ApiOperationException",
+) -> None:
+    from kubernetes.client.exceptions import ApiException
+
+    try:
+        client_ctx.core_api.read_namespace(name=namespace_name)
     except ApiException as ex:
-        api_op_ex = api_exceptions.ApiOperationException.from_api_exception(ex)
-        if not api_op_ex.not_found:
-            raise api_op_ex from ex
-        client_ctx.core_api.create_namespace(body=body)
-        console.print(f"[green]Namespace '{namespace_name}' created successfully.[/]")
+        # not readable either, the create error explains the missing permission
+        raise create_ex from ex
+    console.print(
+        f"[yellow]Namespace '{namespace_name}' already exists. No action required.[/]"
+    )
 
 
 async def update_progress(
     console: Console,
     progress_bar: Progress,
-    executor: deployment_executor.DeploymentExecutor,
+    executor: "deployment_executor.DeploymentExecutor",
 ) -> None:
+    from piceli.k8s.cli.deploy import progress
+    from piceli.k8s.ops.deploy import deployment_executor
+
+    last_state: tuple[int, deployment_executor.ExecutionStatus] | None = None
+
     def update_bar() -> None:
+        # only redraw when something changed since the last update
+        nonlocal last_state
+        completed = len(executor.deployed_nodes)
+        if (completed, executor.status) == last_state:
+            return
+        last_state = completed, executor.status
+        style = "red"
         if executor.status in (
             deployment_executor.ExecutionStatus.DONE,
             deployment_executor.ExecutionStatus.PENDING,
         ):
             style = "green"
-        style = "red"
-        progress_bar.update(
-            task_id, completed=len(executor.deployed_nodes), style=style
-        )
+        progress_bar.update(task_id, completed=completed, style=style)
 
-    total_steps = len(list(executor.graph.traverse_graph()))
-    task_id = progress_bar.add_task(
-        "Deployment", filename="x.txt", total=total_steps, style="green"
-    )
+    total_steps = len(executor.graph.nodes)
+    task_id = progress_bar.add_task("Deployment", total=total_steps, style="green")
+    printed_events = 0
     while not executor.is_final:
-        last_index = None
-        update_bar()
-        for index, progress_event in enumerate(executor.progress):
-            if last_index and index <= last_index:
-                continue
+        # only print the events added since the previous wake-up
+        new_events = executor.progress[printed_events:]
+        printed_events += len(new_events)
+        for progress_event in new_events:
             progress.print_progress(console, progress_event)
-            last_index = index
         update_bar()
-        await asyncio.sleep(1)
+        await executor.wait_for_progress()
     update_bar()
 
 
 async def run_deployment(
     console: Console,
-    executor: deployment_executor.DeploymentExecutor,
+    executor: "deployment_executor.DeploymentExecutor",
     namespace: str,
+    client_ctx: "ClientContext",
 ) -> None:
     """Run the deployment with live progress updates."""
-    with Progress(
-        # TextColumn("[bold blue]Deploying", justify="right"),
-        # BarColumn(bar_width=None),
-        # "[progress.percentage]{task.percentage:>3.1f}%",
-        # "•",
-        # TimeRemainingColumn(),
-        console=console,
-    ) as progress:
+    with Progress(console=console) as progress:
         try:
-            client_ctx = ClientContext()
             await asyncio.gather(
                 executor.deploy(client_ctx, namespace),
                 executor.wait_for_all(client_ctx, namespace),
@@ -7,6 +7,7 @@ from kubernetes.client.exceptions import ApiException
 
 class ReasonEnum(Enum):
     AlreadyExists = "AlreadyExists"
+    Forbidden = "Forbidden"
     NotFound = "NotFound"
     Unknown = None
 
@@ -42,6 +43,10 @@ class ApiOperationException(Exception):
     def already_exists(self) -> bool:
         return self.reason == ReasonEnum.AlreadyExists.value
 
+    @property
+    def forbidden(self) -> bool:
+        return self.reason == ReasonEnum.Forbidden.value
+
     @property
     def is_being_deleted(self) -> bool:
         return "object is being deleted" in self.message
@@ -15,6 +15,9 @@ from piceli.settings import GCE_SA_INFO
 
 logger = logging.getLogger(__name__)
 
+# size of the urllib3 pool of each client, the deployment runs requests in parallel
+CONNECTION_POOL_MAXSIZE = 50
+
 
 class ClientManager:
     """Singleton to manage k8s client instances for different kubeconfigs"""
@@ -46,7 +49,6 @@ class ClientManager:
                     configuration = client.Configuration()
                     loader = config.kube_config.KubeConfigLoader(kubeconfig.as_dict)
                     loader.load_and_set(configuration)
-                self._clients[kubeconfig] = client.ApiClient(configuration)
             else:
                 try:
                     config.load_incluster_config()
@@ -54,7 +56,9 @@ class ClientManager:
                 except config.ConfigException:
                     config.load_kube_config()
                     logger.debug("local connection to k8s")
-                self._clients[kubeconfig] = client.ApiClient()
+                configuration = client.Configuration.get_default_copy()
+            configuration.connection_pool_maxsize = CONNECTION_POOL_MAXSIZE
+            self._clients[kubeconfig] = client.ApiClient(configuration)
         return self._clients[kubeconfig]
 
 
@@ -110,8 +114,9 @@ class ClientContext:
     def extensions_api(self) -> client.ApiextensionsV1Api:
         return client.ApiextensionsV1Api(self.api_client)
 
-    @cached_property
-    def watch(self) -> watch.Watch:
+    @staticmethod
+    def new_watch() -> watch.Watch:
+        """A watch per stream, so concurrent waits do not stop each other"""
         return watch.Watch()
 
 
@@ -15,7 +15,8 @@ class ServiceManager(base.ObjectManager):
     def wait(self, ctx: ClientContext, namespace: Optional[str] = None) -> None:
         logger.info(f"Waiting for service {self.k8s_object}")
         # todo retry for urllib3.exceptions.ProtocolError
-        for event in ctx.watch.stream(
+        watcher = ctx.new_watch()
+        for event in watcher.stream(
             ctx.core_api.list_namespaced_endpoints,
             self._resolve_namespace(namespace),
             field_selector=f"metadata.name={self.k8s_object.name}",
@@ -29,7 +30,7 @@ class ServiceManager(base.ObjectManager):
                         f"Endpoint({address.ip} --> {address.target_ref.kind} {address.target_ref.name})"
                     )
             if details:
-                ctx.watch.stop()
+                watcher.stop()
                 logger.info(f"Done, found service {self.k8s_object} {details=}")
                 return
         raise utils_wait.WaitException(f"Service {self.k8s_object} is not available")
@@ -1,6 +1,7 @@
+import sys
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, NamedTuple
+from typing import Any
 
 from kubernetes.utils.quantity import parse_quantity
 
@@ -20,12 +21,14 @@ class UpdateAction(Enum):
     NEEDS_REPLACEMENT = auto()
 
 
-class PathComparison(NamedTuple):
+@dataclass(slots=True)
+class PathComparison:
     path: Path
     existing: Any
     desired: Any
 
     def __hash__(self) -> int:
+        # the values can be unhashable, the path caches its own hash
         return hash(self.path)
 
 
@@ -194,12 +197,46 @@ DEFAULTED_PATHS = {
 }
 
 
+# marks the node of a prefix trie where one of the inserted paths ends
+_TRIE_END = object()
+
+
+def build_prefix_trie(paths: set[Path]) -> dict:
+    """Build a trie of nested dicts keyed by the elements of each path."""
+    trie: dict = {}
+    for path in paths:
+        node = trie
+        for elem in path:
+            node = node.setdefault(elem, {})
+        node[_TRIE_END] = True
+    return trie
+
+
+def trie_has_prefix_of(trie: dict, path: Path) -> bool:
+    """Check if any path in the trie is a prefix of the given path."""
+    node = trie
+    for elem in path:
+        if _TRIE_END in node:
+            return True
+        if (child := node.get(elem)) is None:
+            return False
+        node = child
+    return _TRIE_END in node
+
+
+_IGNORED_TRIE = build_prefix_trie(IGNORED_PATHS)
+# the trie only covers plain prefixes, keep the wildcard matching otherwise
+_IGNORED_HAS_WILDCARD = any(path.has_wildcard for path in IGNORED_PATHS)
+
+
 def is_path_ignored(path_comparison: PathComparison) -> bool:
     """Check if the path should be completely ignored."""
-    return any(
-        wildcard_contains_path(ignored_path, path_comparison.path)
-        for ignored_path in IGNORED_PATHS
-    )
+    path = path_comparison.path
+    if _IGNORED_HAS_WILDCARD or path.has_wildcard:
+        return any(
+            wildcard_contains_path(ignored_path, path) for ignored_path in IGNORED_PATHS
+        )
+    return trie_has_prefix_of(_IGNORED_TRIE, path)
 
 
 def is_path_defaulted(path_comparison: PathComparison) -> bool:
@@ -214,6 +251,8 @@ RESOURCE_KEYS = {"memory", "cpu", "ephemeral-storage", "storage"}
 
 def are_values_equal(path_comparison: PathComparison) -> bool:
     """Determine if two values are different, considering special cases."""
+    if path_comparison.existing is path_comparison.desired:
+        return True
     if path_comparison.existing == path_comparison.desired:
         return True
     if path_comparison.path[-1] in RESOURCE_KEYS:
@@ -281,15 +320,21 @@ def find_differences(
     desired_spec: dict | None, existing_spec: dict | None, prefix: Path | None = None
 ) -> Differences:
     differences = Differences()
-    prefix = prefix or Path([])
+    if desired_spec is existing_spec:
+        return differences
+    prefix = prefix or Path(())
     _desired_spec, _existing_spec = desired_spec or {}, existing_spec or {}
-    for key in set(_desired_spec).union(_existing_spec):
+    # local names, this is the hottest loop of the comparison
+    desired_get, existing_get = _desired_spec.get, _existing_spec.get
+    extend, add = differences.extend, prefix.add
+    for key in _desired_spec.keys() | _existing_spec.keys():
         path_comparison = PathComparison(
-            path=prefix.add(DictKey(key)),
-            existing=_existing_spec.get(key),
-            desired=_desired_spec.get(key),
+            # the same keys repeat across specs, share a single string for them
+            path=add(DictKey(sys.intern(key) if isinstance(key, str) else key)),
+            existing=existing_get(key),
+            desired=desired_get(key),
         )
-        differences.extend(compare_values(path_comparison))
+        extend(compare_values(path_comparison))
     return differences
 
 
@@ -298,10 +343,14 @@ def determine_update_action(desired: K8sObject, existing: K8sObject) -> CompareR
     return _determine_update_action(kind, desired.spec, existing.spec)
 
 
+FILTERED_KEYS = frozenset({"status", "events"})
+
+
 def filter_spec(spec: dict) -> dict:
-    return {
-        key: value for key, value in spec.items() if key not in ["status", "events"]
-    }
+    # desired specs usually have none of them, no need to copy (callers don't mutate)
+    if FILTERED_KEYS.isdisjoint(spec):
+        return spec
+    return {key: value for key, value in spec.items() if key not in FILTERED_KEYS}
 
 
 def _determine_update_action(kind: str, desired: dict, existing: dict) -> CompareResult:
@@ -309,7 +358,7 @@ def _determine_update_action(kind: str, desired: dict, existing: dict) -> Compar
     filtered_existing_spec = filter_spec(existing)
     differences = find_differences(filtered_desired_spec, filtered_existing_spec)
     considered = differences.considered
-    if any(diff for diff in considered if requires_replacement(kind, diff)):
+    if any(requires_replacement(kind, diff) for diff in considered):
         return CompareResult(
             desired, existing, UpdateAction.NEEDS_REPLACEMENT, differences
         )
@@ -324,17 +373,18 @@ IMMUTABLE_FIELDS = {
     Path.from_string("spec,template"),
     Path.from_string("spec,completions"),
 }
+_IMMUTABLE_TRIE = build_prefix_trie(IMMUTABLE_FIELDS)
+_PVC_SPEC = Path.from_string("spec")
+_PVC_RESOURCES = Path.from_string("spec,resources")
 
 
 def requires_replacement(kind: str, diff: PathComparison) -> bool:
     # Check if any of the immutable field paths is a prefix of the current path
-    if any(diff.path[: len(field)] == field for field in IMMUTABLE_FIELDS):
+    if trie_has_prefix_of(_IMMUTABLE_TRIE, diff.path):
         return True
     # "PersistentVolumeClaim"
     # "spec is immutable after creation except resources.requests for bound claims"
-    if kind == "PersistentVolumeClaim" and diff.path[0] == "spec":
-        if diff.desired is None:
-            return False
-        if diff.path[1] != "resources":
-            return True
+    if kind == "PersistentVolumeClaim" and diff.desired is not None:
+        if diff.path[:1] == _PVC_SPEC:
+            return diff.path[:2] != _PVC_RESOURCES
     return False
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from functools import lru_cache
-from typing import ClassVar, Iterable, Iterator, Union, overload
+from functools import cached_property, lru_cache
+from typing import ClassVar, Iterable, Iterator, Sequence, Union, overload
 
 
 class PathElem(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def id(self) -> str:
@@ -19,9 +21,15 @@ class PathElem(ABC):
         pass
 
 
-@dataclass(frozen=True)
 class DictKey(PathElem):
-    key: str
+    # plain slotted class, built for every key while comparing specs
+    __slots__ = ("key",)
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+    def __repr__(self) -> str:
+        return f"DictKey(key={self.key!r})"
 
     @property
     def id(self) -> str:
@@ -41,21 +49,27 @@ class DictKey(PathElem):
         return self.key
 
 
-@dataclass(frozen=True)
 class ListElemId(PathElem):
-    id_field: str
-    id_value: str
+    __slots__ = ("id_field", "id_value", "_id")
     _id_separator: ClassVar[str] = ":"
 
+    def __init__(self, id_field: str, id_value: str) -> None:
+        self.id_field = id_field
+        self.id_value = id_value
+        self._id = f"{id_field}{self._id_separator}{id_value}"
+
+    def __repr__(self) -> str:
+        return f"ListElemId(id_field={self.id_field!r}, id_value={self.id_value!r})"
+
     @property
     def id(self) -> str:
-        return f"{self.id_field}{self._id_separator}{self.id_value}"
+        return self._id
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, ListElemId):
             return self.id_field == other.id_field and self.id_value == other.id_value
         elif isinstance(other, str):
-            return f"{self.id_field}{self._id_separator}{self.id_value}" == other
+            return self._id == other
         return False
 
     def __hash__(self) -> int:
@@ -81,14 +95,18 @@ class Wildcard(PathElem):
 
 @dataclass(frozen=True)
 class Path:
-    elements: list[PathElem]
+    elements: tuple[PathElem, ...]
     _elem_separator: ClassVar[str] = ","
 
     def __str__(self) -> str:
+        return self._str
+
+    @cached_property
+    def _str(self) -> str:
         return self._elem_separator.join(elem.id for elem in self.elements)
 
     def add(self, element: PathElem) -> "Path":
-        return Path(self.elements + [element])
+        return Path(self.elements + (element,))
 
     def __add__(self, other: "Path") -> "Path":
         if not isinstance(other, Path):
@@ -107,20 +125,27 @@ class Path:
         for part in path:
             if Wildcard._wildcard == part:
                 elements.append(Wildcard())
-            elif ListElemId._id_separator in part:
-                key, value = part.split(ListElemId._id_separator)
-                elements.append(ListElemId(key, value))
+            elif (parts := part.partition(ListElemId._id_separator))[1]:
+                elements.append(ListElemId(parts[0], parts[2]))
             else:
                 elements.append(DictKey(part))
-        return cls(elements)
+        return cls(tuple(elements))
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Path):
             return False
+        if not (self.has_wildcard or other.has_wildcard):
+            # plain paths, the cached hashes discard most of the differences
+            return self._hash == other._hash and self.elements == other.elements
         return wildcard_match_paths(self, other)
 
     def __hash__(self) -> int:
-        return hash(tuple(self.elements))
+        return self._hash
+
+    @cached_property
+    def _hash(self) -> int:
+        # paths are immutable, `add` and `+` build new ones
+        return hash(self.elements)
 
     def __iter__(self) -> Iterator[PathElem]:
         return iter(self.elements)
@@ -142,8 +167,15 @@ class Path:
     def __len__(self) -> int:
         return len(self.elements)
 
+    @cached_property
+    def has_wildcard(self) -> bool:
+        return any(isinstance(elem, Wildcard) for elem in self.elements)
+
     def __contains__(self, item: object) -> bool:
         if isinstance(item, Path):
+            if not (self.has_wildcard or item.has_wildcard):
+                # plain paths only match as a prefix, compare the slice directly
+                return self.elements[: len(item.elements)] == item.elements
             return wildcard_contains(item.elements, self.elements)
         if isinstance(item, PathElem):
             return item in self.elements
@@ -152,7 +184,7 @@ class Path:
         return False
 
 
-def wildcard_contains(seq1: list[PathElem], seq2: list[PathElem]) -> bool:
+def wildcard_contains(seq1: Sequence[PathElem], seq2: Sequence[PathElem]) -> bool:
     @lru_cache(maxsize=None)
     def match_helper(index1: int, index2: int) -> bool:
         if index1 == len(seq1):
@@ -180,7 +212,7 @@ def wildcard_contains(seq1: list[PathElem], seq2: list[PathElem]) -> bool:
     return any(match_helper(0, start) for start in range(len(seq2) + 1))
 
 
-def match_sequences(seq1: list[PathElem], seq2: list[PathElem]) -> bool:
+def match_sequences(seq1: Sequence[PathElem], seq2: Sequence[PathElem]) -> bool:
     @lru_cache(maxsize=None)
     def match_helper(index1: int, index2: int) -> bool:
         # End of both sequences reached, successful match
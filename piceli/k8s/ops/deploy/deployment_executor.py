@@ -1,16 +1,19 @@
 import asyncio
 import logging
 from enum import StrEnum, auto
-from typing import NamedTuple
+from typing import Iterator, NamedTuple
 
 from piceli.k8s.exceptions import api_exceptions
 from piceli.k8s.k8s_client.client import ClientContext
-from piceli.k8s.object_manager.factory import ManagerFactory
+from piceli.k8s.k8s_objects.base import K8sObjectIdentifier
 from piceli.k8s.ops.compare import object_comparer
 from piceli.k8s.ops.deploy import deployment_graph, deployment_progress
 
 logger = logging.getLogger(__name__)
 
+# seconds to keep collecting progress after a wake-up, bursts are rendered at once
+PROGRESS_DEBOUNCE = 0.25
+
 
 class NoActionNeeded(Exception):
     pass
@@ -31,10 +34,17 @@ class LevelNodes(NamedTuple):
 class DeploymentExecutor:
     def __init__(self, graph: deployment_graph.DeploymentGraph):
         self.graph = graph
-        self.deployed_nodes: list[LevelNodes] = []
-        self.waited_nodes: set = set()
+        # flat list of the deployed nodes, each level ends at its _level_ends offset
+        self.deployed_nodes: list[deployment_graph.ObjectNode] = []
+        self._level_ends: list[int] = []
+        self.waited_nodes: set[K8sObjectIdentifier] = set()
         self.status = ExecutionStatus.PENDING
         self.progress: list[deployment_progress.Progress] = []
+        self.progress_event = asyncio.Event()
+        # one wait per node (and rollback flag), shared by all the nodes depending on it
+        self._wait_tasks: dict[
+            tuple[K8sObjectIdentifier, bool], asyncio.Future[None]
+        ] = {}
 
     @property
     def is_done(self) -> bool:
@@ -48,40 +58,73 @@ class DeploymentExecutor:
     def is_final(self) -> bool:
         return self.is_done or self.is_rolled_back
 
+    def deployed_levels(self) -> Iterator[LevelNodes]:
+        start = 0
+        for level, end in enumerate(self._level_ends):
+            yield LevelNodes(level, self.deployed_nodes[start:end])
+            start = end
+
+    def add_progress(self, progress: deployment_progress.Progress) -> None:
+        self.progress.append(progress)
+        self.progress_event.set()
+
+    async def wait_for_progress(self, debounce: float = PROGRESS_DEBOUNCE) -> None:
+        await self.progress_event.wait()
+        await asyncio.sleep(debounce)
+        self.progress_event.clear()
+
     async def wait_for_all(self, ctx: ClientContext, namespace: str | None) -> None:
-        for level, nodes in self.deployed_nodes:
+        for level, nodes in self.deployed_levels():
             logger.info(f"waiting for graph {level=} {nodes=}")
-            await asyncio.gather(
-                *(self._wait_for_node(node, ctx, namespace) for node in nodes)
-            )
+            # handle each wait as soon as it finishes, a failure is raised right away
+            for wait_task in asyncio.as_completed(
+                [self._wait_task(node, ctx, namespace) for node in nodes]
+            ):
+                await wait_task
 
     async def deploy(self, ctx: ClientContext, namespace: str | None = None) -> None:
-        self.progress.append(deployment_progress.ExecutionProgress.deploy(self.status))
+        self.add_progress(deployment_progress.ExecutionProgress.deploy(self.status))
         try:
             for level, nodes in enumerate(self.graph.traverse_graph()):
-                self.progress.append(
+                self.add_progress(
                     deployment_progress.GraphLevelProgress.apply(level, nodes)
                 )
                 await asyncio.gather(
-                    *(self.apply_node(node, ctx, namespace) for node in nodes)
+                    *[self.apply_node(node, ctx, namespace) for node in nodes]
                 )
-                self.progress.append(
+                self.add_progress(
                     deployment_progress.GraphLevelProgress.success(level, nodes)
                 )
-                self.deployed_nodes.append(LevelNodes(level, nodes))
+                self.deployed_nodes.extend(nodes)
+                self._level_ends.append(len(self.deployed_nodes))
             self.status = ExecutionStatus.DONE
-            self.progress.append(
+            self.add_progress(
                 deployment_progress.ExecutionProgress.success(self.status)
             )
         except Exception as ex:
             logger.error(f"Deployment failed: {ex}")
             self.status = ExecutionStatus.FAILED
-            self.progress.append(
+            self.add_progress(
                 deployment_progress.ExecutionProgress.error(self.status, ex)
             )
             await self.rollback(ctx, namespace)
             raise
 
+    def _wait_task(
+        self,
+        node: deployment_graph.ObjectNode,
+        ctx: ClientContext,
+        namespace: str | None,
+        on_rollback: bool = False,
+    ) -> asyncio.Future[None]:
+        key = (node.identifier, on_rollback)
+        if (wait_task := self._wait_tasks.get(key)) is None:
+            wait_task = asyncio.ensure_future(
+                self._wait_for_node(node, ctx, namespace, on_rollback)
+            )
+            self._wait_tasks[key] = wait_task
+        return wait_task
+
     async def _wait_for_node(
         self,
         node: deployment_graph.ObjectNode,
@@ -95,12 +138,13 @@ class DeploymentExecutor:
                 deployment_graph.DeploymentStatus.PENDING,
             ]:
                 return
-            if node.previous_object is None:
+            if (previous_manager := node.previous_manager) is None:
                 return
-            object_manager = ManagerFactory.get_manager(node.previous_object)
+            object_manager = previous_manager
         else:
             object_manager = node.deploying_object
-        object_manager.wait(ctx, namespace)
+        # the wait blocks on a watch stream, keep the event loop free meanwhile
+        await asyncio.to_thread(object_manager.wait, ctx, namespace)
         self.waited_nodes.add(node.identifier)
 
     async def _wait_for_dependencies(
@@ -113,11 +157,8 @@ class DeploymentExecutor:
         logger.info(f"waiting for dependencies {node.identifier} {on_rollback=}")
         await asyncio.gather(
             *[
-                self._wait_for_node(
-                    self.graph.nodes[dep_id], ctx, namespace, on_rollback
-                )
-                for dep_id in node.dependencies
-                if dep_id not in self.waited_nodes
+                self._wait_task(self.graph.nodes[dep_id], ctx, namespace, on_rollback)
+                for dep_id in node.dependencies - self.waited_nodes
             ]
         )
 
@@ -129,28 +170,28 @@ class DeploymentExecutor:
         on_rollback: bool = False,
     ) -> None:
         if on_rollback:
-            if not node.previous_object:
+            if (previous_manager := node.previous_manager) is None:
                 node.deploying_object.delete(ctx, namespace)
                 node.deployment_status = deployment_graph.DeploymentStatus.ROLLED_BACK
                 return
-            object_manager = ManagerFactory.get_manager(node.previous_object)
+            object_manager = previous_manager
             done_status = deployment_graph.DeploymentStatus.ROLLED_BACK
-            self.progress.append(deployment_progress.NodeProgress.rollback(node))
+            self.add_progress(deployment_progress.NodeProgress.rollback(node))
         else:
             object_manager = node.deploying_object
             done_status = deployment_graph.DeploymentStatus.DONE
-            self.progress.append(deployment_progress.NodeProgress.apply(node))
+            self.add_progress(deployment_progress.NodeProgress.apply(node))
         try:
             await self._wait_for_dependencies(node, ctx, namespace, on_rollback)
             await self._apply_node(node, ctx, namespace, object_manager)
             node.deployment_status = done_status
-            self.progress.append(deployment_progress.NodeProgress.done(node))
+            self.add_progress(deployment_progress.NodeProgress.done(node))
         except NoActionNeeded:
             node.deployment_status = deployment_graph.DeploymentStatus.NO_ACTION_NEEDED
-            self.progress.append(deployment_progress.NodeProgress.done(node))
+            self.add_progress(deployment_progress.NodeProgress.done(node))
         except Exception as ex:
             node.deployment_status = deployment_graph.DeploymentStatus.FAILED
-            self.progress.append(deployment_progress.NodeProgress.error(node, ex))
+            self.add_progress(deployment_progress.NodeProgress.error(node, ex))
             raise
 
     async def _apply_node(
@@ -166,7 +207,7 @@ class DeploymentExecutor:
             compare_result = object_comparer.determine_update_action(
                 object_manager.k8s_object, existing_obj
             )
-            self.progress.append(
+            self.add_progress(
                 deployment_progress.NodeProgress.compare(node, compare_result)
             )
             if compare_result.no_action_needed:
@@ -182,7 +223,7 @@ class DeploymentExecutor:
         except api_exceptions.ApiOperationException as ex:
             if ex.not_found:
                 object_manager.create(ctx, namespace)
-                self.progress.append(deployment_progress.NodeProgress.new_obj(node))
+                self.add_progress(deployment_progress.NodeProgress.new_obj(node))
             else:
                 raise
 
@@ -204,18 +245,16 @@ class DeploymentExecutor:
         ctx: ClientContext,
         namespace: str | None,
     ) -> None:
-        self.progress.append(
-            deployment_progress.ExecutionProgress.rollback(self.status)
-        )
+        self.add_progress(deployment_progress.ExecutionProgress.rollback(self.status))
         self.waited_nodes = set()
-        for level, nodes in self.deployed_nodes:
-            self.progress.append(
+        for level, nodes in self.deployed_levels():
+            self.add_progress(
                 deployment_progress.GraphLevelProgress.rollback(level, nodes)
             )
             await asyncio.gather(
-                *(self.rollback_node(node, ctx, namespace) for node in nodes)
+                *[self.rollback_node(node, ctx, namespace) for node in nodes]
             )
         self.status = ExecutionStatus.ROLLED_BACK
-        self.progress.append(
+        self.add_progress(
             deployment_progress.ExecutionProgress.rolled_back(self.status)
         )
@@ -5,6 +5,7 @@ from typing import Iterable
 
 from piceli.k8s.k8s_objects.base import K8sObject, K8sObjectIdentifier
 from piceli.k8s.object_manager.base import ObjectManager
+from piceli.k8s.object_manager.factory import ManagerFactory
 
 
 class DeploymentStatus(StrEnum):
@@ -21,6 +22,18 @@ class ObjectNode:
     dependencies: set[K8sObjectIdentifier] = field(default_factory=set)
     previous_object: K8sObject | None = None
     deployment_status: DeploymentStatus = DeploymentStatus.PENDING
+    _previous_manager: ObjectManager | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def previous_manager(self) -> ObjectManager | None:
+        """Manager of the previous object, built once and reused on wait/rollback"""
+        if self.previous_object is None:
+            return None
+        if self._previous_manager is None:
+            self._previous_manager = ManagerFactory.get_manager(self.previous_object)
+        return self._previous_manager
 
     @property
     def identifier(self) -> K8sObjectIdentifier:
@@ -35,9 +48,13 @@ class ObjectNode:
 class DeploymentGraph:
     nodes: dict[K8sObjectIdentifier, ObjectNode] = field(default_factory=dict)
     out_of_model_objects: list[ObjectManager] = field(default_factory=list)
+    _levels: list[list[ObjectNode]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def add_node(self, node: ObjectNode) -> None:
         self.nodes[node.identifier] = node
+        self._levels = None
 
     def add_dependency(
         self, from_identifier: K8sObjectIdentifier, to_identifier: K8sObjectIdentifier
@@ -49,6 +66,7 @@ class DeploymentGraph:
         if from_identifier == to_identifier:
             return None
         self.nodes[from_identifier].dependencies.add(to_identifier)
+        self._levels = None
 
     def add_dependencies(
         self,
@@ -78,6 +96,12 @@ class DeploymentGraph:
 
     def traverse_graph(self) -> list[list[ObjectNode]]:
         """Organize nodes into levels for parallel deployment."""
+        # the graph does not change during the deployment, compute the levels once
+        if self._levels is None:
+            self._levels = self._build_levels()
+        return self._levels
+
+    def _build_levels(self) -> list[list[ObjectNode]]:
         levels_dict: dict[int, list[ObjectNode]] = defaultdict(list)
         node_to_level: dict[K8sObjectIdentifier, int] = {}
 
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Any, Callable, NamedTuple
+from typing import Any, Callable, Collection, NamedTuple
 
 from kubernetes import client
 
@@ -112,18 +112,18 @@ APIS = ["core_api", "batch_api", "apps_api", "rbacauthorization_api", "hpa_api"]
 def get_all_from_context(
     ctx: ClientContext,
     namespace: str | None = None,
-    ignore_kinds: list[str] | None = None,
+    ignore_kinds: Collection[str] | None = None,
 ) -> dict[str | None, list[K8sObject]]:
     namespaces = [namespace] if namespace else get_all_namespaces(ctx)
     objects: dict[str | None, list[K8sObject]] = defaultdict(list)
-    ignore_kinds = ignore_kinds or []
+    ignored_kinds = frozenset(ignore_kinds or ())
     for api_name in APIS:
         api = getattr(ctx, api_name)
         resources = api.get_api_resources()
         if isinstance(resources, client.V1APIResourceList):
             api_version = resources.group_version
             for resource in resources.resources:
-                if resource.kind in ignore_kinds:
+                if resource.kind in ignored_kinds:
                     continue
                 if "list" not in resource.verbs:
                     continue
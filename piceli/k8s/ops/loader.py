@@ -4,6 +4,7 @@ import logging
 import os
 import pkgutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from importlib import util as importlib_util
 from itertools import chain
 from pathlib import Path
@@ -24,14 +25,18 @@ from piceli.k8s.k8s_objects.base import (
 )
 from piceli.k8s.templates.deployable.base import Deployable
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pyyaml built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+MAX_LOADER_WORKERS = 32
+
 
 def string_in_k8s_models(target_string: str) -> bool:
-    if target_string in dir(k8s_models):
-        attr = getattr(k8s_models, target_string)
-        return isinstance(attr, type)
-    return False
+    return isinstance(vars(k8s_models).get(target_string), type)
 
 
 def load_models_from_module_names(module_names: Iterable[str]) -> Iterator[K8sObject]:
@@ -44,8 +49,8 @@ def load_models_from_module_names(module_names: Iterable[str]) -> Iterator[K8sOb
 
 
 def load_models_from_module(module: ModuleType) -> Iterator[K8sObject]:
-    for attr_name in dir(module):
-        attr = getattr(module, attr_name)
+    # sorted by name, same order that dir(module) gave
+    for attr_name, attr in sorted(vars(module).items()):
         if isinstance(attr, Deployable):
             origin: ObjectOrigin = OriginTemplate(module.__name__, attr_name)
             for spec in attr.api_data():
@@ -66,20 +71,36 @@ def load_resources_from_any(
             yield from load_resources_from_any(doc, origin)
 
 
+def load_resources_from_file(path: str) -> list[K8sObject]:
+    """
+    Loads and returns the resources of a single YAML/JSON file.
+    """
+    # binary mode, the parsers detect the encoding without python decoding
+    with open(path, "rb") as file:
+        if path.lower().endswith(".yaml") or path.lower().endswith(".yml"):
+            origin = OriginYAML(path)
+            return [
+                resource
+                for document in yaml.load_all(file, Loader=SafeLoader)
+                for resource in load_resources_from_any(document, origin)
+            ]
+        if path.lower().endswith(".json"):
+            loaded_json = json.load(file)
+            return list(load_resources_from_any(loaded_json, OriginJSON(path)))
+    logger.info(f"ignoring file: {path}")
+    return []
+
+
 def load_resources_from_files(paths: Iterable[str]) -> Iterator[K8sObject]:
     """
     Loads and returns a list of resource dictionaries from specified YAML/JSON files.
     """
-    for path in paths:
-        with open(path) as file:
-            if path.lower().endswith(".yaml") or path.lower().endswith(".yml"):
-                documents = list(yaml.safe_load_all(file))
-                yield from load_resources_from_any(documents, OriginYAML(path))
-            elif path.lower().endswith(".json"):
-                loaded_json = json.load(file)
-                yield from load_resources_from_any(loaded_json, OriginJSON(path))
-            else:
-                logger.info(f"ignoring file: {path}")
+    if not (_paths := list(paths)):
+        return
+    # the files are read and parsed concurrently, results keep the order of paths
+    with ThreadPoolExecutor(max_workers=min(MAX_LOADER_WORKERS, len(_paths))) as pool:
+        for resources in pool.map(load_resources_from_file, _paths):
+            yield from resources
 
 
 def load_all_resources(
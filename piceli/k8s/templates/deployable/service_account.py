@@ -8,6 +8,21 @@ from piceli.k8s.templates.deployable import base
 from piceli.k8s.templates.deployable import role as role_lib
 from piceli.k8s.templates.deployable import role_binding
 
+# kubernetes object names (RFC 1123 labels) cannot exceed 63 characters
+MAX_NAME_LENGTH = 63
+# the descriptive role binding name adds "sa-" and "-role" to the short one
+ROLE_BINDING_PREFIXES_LENGTH = len("sa-") + len("-role")
+
+
+def role_binding_name(sa_name: str, role_name: str) -> str:
+    """Name of the role binding, the descriptive one if it is not too long"""
+    short_name = f"{sa_name}-{role_name}"
+    if len(short_name) + ROLE_BINDING_PREFIXES_LENGTH <= MAX_NAME_LENGTH:
+        return f"sa-{sa_name}-role-{role_name}"
+    if len(short_name) <= MAX_NAME_LENGTH:
+        return short_name
+    raise ValueError(f"role binding name {short_name} is too long")
+
 
 class ServiceAccount(base.Deployable):
     """
@@ -58,13 +73,12 @@ class ServiceAccount(base.Deployable):
         self, role: role_lib.K8sRole
     ) -> role_binding.RoleBinding | role_binding.ClusterRoleBinding:
         """Gets the service related to this Deployment"""
-        if len(name := f"sa-{self.name}-role-{role.name}") > 63:
-            if len(name := f"{self.name}-{role.name}") > 63:
-                raise ValueError(f"role binding name {name} is too long")
+        sa_name, role_name = self.name, role.name
+        name = role_binding_name(sa_name, role_name)
         if isinstance(role, role_lib.ClusterRole):
             return role_binding.ClusterRoleBinding(
-                name=name, service_account_name=self.name, role_name=role.name
+                name=name, service_account_name=sa_name, role_name=role_name
             )
         return role_binding.RoleBinding(
-            name=name, service_account_name=self.name, role_name=role.name
+            name=name, service_account_name=sa_name, role_name=role_name
         )
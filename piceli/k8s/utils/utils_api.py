@@ -1,30 +1,54 @@
 # Tooling implemented based on the kubernetes library:
 # https://github.com/kubernetes-client/python/blob/master/kubernetes/utils/create_from_yaml.py
-import re
+import string
 from functools import lru_cache
 
-UPPER_FOLLOWED_BY_LOWER_RE = re.compile("(.)([A-Z][a-z]+)")
-LOWER_OR_NUM_FOLLOWED_BY_UPPER_RE = re.compile("([a-z0-9])([A-Z])")
+UPPER = frozenset(string.ascii_uppercase)
+LOWER = frozenset(string.ascii_lowercase)
+LOWER_OR_NUM = LOWER | frozenset(string.digits)
 
 
+@lru_cache(maxsize=256)
 def get_api_func_ending(kind: str) -> str:
     """Returns the end of an api call based into the kind"""
-    call_suffix = UPPER_FOLLOWED_BY_LOWER_RE.sub(r"\1_\2", kind)
-    call_suffix = LOWER_OR_NUM_FOLLOWED_BY_UPPER_RE.sub(r"\1_\2", call_suffix).lower()
-    return call_suffix
+    # camel to snake case in one pass, eg. APIService -> api_service
+    call_suffix: list[str] = []
+    append = call_suffix.append
+    last = len(kind) - 1
+    for i, char in enumerate(kind):
+        if (
+            i
+            and char in UPPER
+            and (kind[i - 1] in LOWER_OR_NUM or (i < last and kind[i + 1] in LOWER))
+        ):
+            append("_")
+        append(char)
+    return "".join(call_suffix).lower()
 
 
 def get_available_api_methods(api: object, kind: str) -> list[str]:
     """Returns the available api methods for the object kind"""
-    suffix = get_api_func_ending(kind)
-    operations = ["create", "delete", "list", "patch", "read", "replace"]
-    # not considered methods: "delete_collection", "watch", "watch_list"
-    potential_methods = []
-    for op in operations:
-        for namespaced in ["", "namespaced_"]:
-            method_name = f"{op}_{namespaced}{suffix}"
-            potential_methods.append(method_name)
-    return [func for func in dir(api) if func in potential_methods]
+    # a copy, the cached index is shared between callers
+    return list(_get_api_methods_index(api).get(get_api_func_ending(kind), ()))
+
+
+# not considered methods: "delete_collection", "watch", "watch_list"
+API_OPERATIONS = frozenset({"create", "delete", "list", "patch", "read", "replace"})
+NAMESPACED_PREFIX = "namespaced_"
+
+
+@lru_cache(maxsize=64)
+def _get_api_methods_index(api: object) -> dict[str, tuple[str, ...]]:
+    """Groups the operation methods of the api by the kind suffix, in dir order"""
+    index: dict[str, list[str]] = {}
+    for func in dir(api):
+        op, _, suffix = func.partition("_")
+        if op not in API_OPERATIONS:
+            continue
+        index.setdefault(suffix, []).append(func)
+        if suffix.startswith(NAMESPACED_PREFIX):
+            index.setdefault(suffix[len(NAMESPACED_PREFIX) :], []).append(func)
+    return {suffix: tuple(methods) for suffix, methods in index.items()}
 
 
 def is_namespaced(methods: list[str]) -> bool:
@@ -32,6 +56,7 @@ def is_namespaced(methods: list[str]) -> bool:
     return any("namespaced" in method for method in methods)
 
 
+@lru_cache(maxsize=256)
 def build_api_method_name(method: str, namespaced: bool, kind: str) -> str:
     suffix = get_api_func_ending(kind)
     if namespaced:
@@ -53,7 +53,8 @@ def wait(
     field_selector = None if label_selector else f"metadata.name={obj_name}"
     phases_set = {p.value for p in phases} if phases else set()
     last_event = None
-    for event in ctx.watch.stream(
+    watcher = ctx.new_watch()
+    for event in watcher.stream(
         list_func,
         *args,
         field_selector=field_selector,
@@ -65,7 +66,7 @@ def wait(
         if result := process_event(
             event, condition, phases_set, check_readiness, check_replicas, obj_name
         ):
-            ctx.watch.stop()
+            watcher.stop()
             return result
         if check_for_image_pull_error(ctx, event):
             raise PullImageError(f"Abort wait! Failed to pull image for {obj_name}.")
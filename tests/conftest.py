@@ -1,20 +1,27 @@
+import copy
 import difflib
 import json
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
 import pytest
 from kubernetes.client.exceptions import ApiException
 
 from piceli.k8s.exceptions import api_exceptions
+from piceli.k8s.k8s_objects.base import K8sObject
+from piceli.k8s.ops import loader
 
 
 def pytest_assertrepr_compare(op: str, left: Any, right: Any) -> Optional[list[str]]:
     if isinstance(left, dict) and isinstance(right, dict) and op == "==":
         # Serialize the dictionaries to JSON formatted strings, sorted to ensure consistency
-        left_str = json.dumps(left, sort_keys=True, indent=2).splitlines(keepends=True)
-        right_str = json.dumps(right, sort_keys=True, indent=2).splitlines(
-            keepends=True
-        )
+        left_json = json.dumps(left, sort_keys=True, indent=2)
+        right_json = json.dumps(right, sort_keys=True, indent=2)
+        if left_json == right_json:
+            # same serialization, a diff would be empty
+            return None
+        left_str = left_json.splitlines(keepends=True)
+        right_str = right_json.splitlines(keepends=True)
         # Generate the unified diff
         diff = list(
             difflib.unified_diff(left_str, right_str, fromfile="left", tofile="right")
@@ -33,15 +40,16 @@ def pytest_assertrepr_compare(op: str, left: Any, right: Any) -> Optional[list[s
 
 RESOURCE_JSON = '{"apiVersion": "batch/v1", "kind": "Job", "metadata": {"name": "tasker-scheduler"}, "spec": {"template": {"metadata": {"name": "tasker-scheduler"}, "spec": {"containers": [{"command": ["sh", "-c", "echo \'scheduler\' && sleep 30"], "image": "busybox", "name": "tasker-scheduler"}], "restartPolicy": "Never"}}}}'
 
+RESOURCE_DICT = json.loads(RESOURCE_JSON)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def resource_dict() -> dict:
-    """Parse JSON string to a Python dictionary."""
-    return json.loads(RESOURCE_JSON)
+    """JSON string parsed once to a Python dictionary, shared and read only."""
+    return RESOURCE_DICT
 
 
-@pytest.fixture
-def not_found_api_op_exception() -> api_exceptions.ApiOperationException:
+def _not_found_api_op_exception() -> api_exceptions.ApiOperationException:
     api = ApiException()
     api.status = 404
     api.reason = "NotFound"
@@ -51,12 +59,29 @@ def not_found_api_op_exception() -> api_exceptions.ApiOperationException:
     return api_exceptions.ApiOperationException.from_api_exception(api)
 
 
+@pytest.fixture
+def not_found_api_op_exception() -> api_exceptions.ApiOperationException:
+    # a new exception per test, raising it sets its traceback and context
+    return _not_found_api_op_exception()
+
+
 @pytest.fixture
 def todo() -> api_exceptions.ApiOperationException:
-    api = ApiException()
-    api.status = 404
-    api.reason = "NotFound"
-    api.message = "Service not found"
-    api.body = '{"kind":"Status","apiVersion":"v1","metadata":{},"status":"Failure","message":"cronjobs.batch \\"cronjob-name\\" not found","reason":"NotFound","details":{"name":"cronjob-name","group":"batch","kind":"cronjobs"},"code":404}\n'
+    return _not_found_api_op_exception()
 
-    return api_exceptions.ApiOperationException.from_api_exception(api)
+
+@lru_cache(maxsize=None)
+def _load_resources(test_yaml: str) -> tuple[K8sObject, ...]:
+    """Parses each test yaml once per session"""
+    return tuple(loader.load_resources_from_files([test_yaml]))
+
+
+@pytest.fixture
+def load_resources() -> Callable[[str], list[K8sObject]]:
+    """Loads the objects of a test yaml, a new copy for each test"""
+
+    def load(test_yaml: str) -> list[K8sObject]:
+        # the tests may modify the objects, they cannot share the cached ones
+        return copy.deepcopy(list(_load_resources(test_yaml)))
+
+    return load
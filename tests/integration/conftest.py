@@ -1,20 +1,22 @@
 import os
+from typing import Callable
 
 import pytest
 
 from piceli.k8s.k8s_objects.base import K8sObject
-from piceli.k8s.ops import loader
 
 
 @pytest.fixture
-def resources() -> list[K8sObject]:
+def resources(load_resources: Callable[[str], list[K8sObject]]) -> list[K8sObject]:
     test_yaml = os.path.join(os.path.dirname(__file__), "resources", "deployment.yml")
-    return list(loader.load_resources_from_files([test_yaml]))
+    return load_resources(test_yaml)
 
 
 @pytest.fixture
-def resources_update() -> list[K8sObject]:
+def resources_update(
+    load_resources: Callable[[str], list[K8sObject]]
+) -> list[K8sObject]:
     test_yaml = os.path.join(
         os.path.dirname(__file__), "resources", "deployment_update.yml"
     )
-    return list(loader.load_resources_from_files([test_yaml]))
+    return load_resources(test_yaml)
@@ -1,3 +1,4 @@
+import logging
 import time
 from typing import TYPE_CHECKING, Generator
 
@@ -17,9 +18,12 @@ from piceli.k8s.ops.deploy import deploy_op
 if TYPE_CHECKING:
     from _pytest.fixtures import FixtureRequest
 
+logger = logging.getLogger(__name__)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def ctx() -> ClientContext:
+    # api clients are cached on the context, reuse them for all the tests
     return ClientContext()
 
 
@@ -32,10 +36,13 @@ def test_namespace(
     try:
         ctx.core_api.read_namespace(name=namespace_name)
         ctx.core_api.delete_namespace(name=namespace_name)
+        # exponential backoff, quick deletions are noticed without a full second
+        delay = 0.05
         while True:
             ctx.core_api.read_namespace(name=namespace_name)
-            print(f"Waiting for namespace {namespace_name} to be deleted")
-            time.sleep(1)
+            logger.debug("Waiting for namespace %s to be deleted", namespace_name)
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
     except ApiException as ex:
         api_op_ex = api_exceptions.ApiOperationException.from_api_exception(ex)
         if not api_op_ex.not_found:
@@ -46,7 +53,7 @@ def test_namespace(
     try:
         ctx.core_api.delete_namespace(name=namespace_name, body={})
     except ApiException as e:
-        print(f"Failed to delete namespace {namespace_name}: {str(e)}")
+        logger.warning("Failed to delete namespace %s: %s", namespace_name, e)
 
 
 def test_deployment_and_update(
@@ -55,8 +62,7 @@ def test_deployment_and_update(
     resources: list[K8sObject],
     resources_update: list[K8sObject],
 ) -> None:
-    ctx = ClientContext()
-    ignore_kinds = ["Event", "Endpoints", "Pod", "ReplicaSet", "Job"]
+    ignore_kinds = frozenset({"Event", "Endpoints", "Pod", "ReplicaSet", "Job"})
     # get all objects of the initial namespace
     existing = fetcher.get_all_from_context(
         ctx, test_namespace, ignore_kinds=ignore_kinds
@@ -69,17 +75,19 @@ def test_deployment_and_update(
         ctx, test_namespace, ignore_kinds=ignore_kinds
     )
     # compare the objects before and after deployment
-    initial_diffs = compare_op.compare_object_sets(existing, after_deployment)
-    assert initial_diffs[test_namespace].removed == []
-    assert initial_diffs[test_namespace].modified == {}
+    initial_diff = compare_op.compare_object_sets(existing, after_deployment)[
+        test_namespace
+    ]
+    assert initial_diff.removed == []
+    assert initial_diff.modified == {}
     # We only expect to find differences on the objects added on:
     # except on the storage class, which is a cluster-wide resource
     # the storage class will be added only on new minikube instances, not delete on every tests
     # so we can reuse if running tests in different namespaces in parallel
-    assert len(initial_diffs[test_namespace].added) >= len(resources) - 1
-    added_ids = {obj.unnamespaced_id for obj in initial_diffs[test_namespace].added}
+    assert len(initial_diff.added) >= len(resources) - 1
+    added_ids = {obj.unnamespaced_id for obj in initial_diff.added}
     expected_ids = {
-        obj.unnamespaced_id for obj in resources if obj.kind not in ["StorageClass"]
+        obj.unnamespaced_id for obj in resources if obj.kind != "StorageClass"
     }
     assert added_ids == expected_ids
 
@@ -91,21 +99,21 @@ def test_deployment_and_update(
         ctx, test_namespace, ignore_kinds=ignore_kinds
     )
     # compare the objects before and after update
-    update_diffs = compare_op.compare_object_sets(after_deployment, final_objects)
-    assert update_diffs[test_namespace].removed == []
-    assert update_diffs[test_namespace].added == []
+    update_diff = compare_op.compare_object_sets(after_deployment, final_objects)[
+        test_namespace
+    ]
+    assert update_diff.removed == []
+    assert update_diff.added == []
     # We only expect to find differences on the objects modified on:
     # - tests/integration/resources/deployment_update.yml
     # over original deployment
     # - tests/integration/resources/deployment.yml
 
-    assert (
-        len(update_diffs[test_namespace].modified) == 2
-    )  # disabled PVC for ubuntu tests
+    assert len(update_diff.modified) == 2  # disabled PVC for ubuntu tests
 
     # check that one of the differences is a cronjob
     # the only required change is the cronjob schedule
-    cronjob_diff = update_diffs[test_namespace].modified[
+    cronjob_diff = update_diff.modified[
         K8sObjectIdentifier(name="example-cronjob", kind="CronJob", namespace=None)
     ]
     assert len(cronjob_diff.compare_result.differences.considered) == 1
@@ -121,7 +129,7 @@ def test_deployment_and_update(
     # This test doesn't work in github ci/cd, disabled for now
     # # check that one of the differences is a PVC
     # # the only required change is doubling the storage size from 0.1Gi to 0.2Gi
-    # pvc_diff = update_diffs[test_namespace].modified[
+    # pvc_diff = update_diff.modified[
     #     K8sObjectIdentifier(
     #         name="example-persistentvolumeclaim",
     #         kind="PersistentVolumeClaim",
@@ -143,7 +151,7 @@ def test_deployment_and_update(
 
     # check that one of them is a deployment
     # the only required change is the image
-    deployment_diff = update_diffs[test_namespace].modified[
+    deployment_diff = update_diff.modified[
         K8sObjectIdentifier(
             name="example-deployment", kind="Deployment", namespace=None
         )
@@ -3,7 +3,7 @@ import pytest
 from piceli.k8s.k8s_objects.base import K8sObject, OriginYAML
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def k8s_objects() -> list[K8sObject]:
     return [
         K8sObject(
@@ -6,13 +6,14 @@ from typer.testing import CliRunner
 from piceli.k8s.cli import app
 from piceli.k8s.cli.deploy import detail
 from piceli.k8s.k8s_objects.base import K8sObject, OriginYAML
-from piceli.k8s.object_manager.factory import ObjectManager
+from piceli.k8s.object_manager.factory import ManagerFactory, ObjectManager
+from piceli.k8s.ops import loader
 from piceli.k8s.ops.compare import object_comparer
 
 runner = CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def k8s_object() -> K8sObject:
     return K8sObject(
         spec={"apiVersion": "v1", "kind": "Pod", "metadata": {"name": "test-pod"}},
@@ -46,12 +47,13 @@ def obj_compare_result(k8s_object: K8sObject) -> detail.ObjCompareResult:
 def test_detail_with_changes(
     k8s_object: K8sObject, obj_compare_result: detail.ObjCompareResult
 ) -> None:
-    with mock.patch(
-        "piceli.k8s.ops.loader.load_all", return_value=[k8s_object]
-    ), mock.patch(
-        "piceli.k8s.object_manager.factory.ManagerFactory.get_manager"
-    ) as mock_get_manager, mock.patch(
-        "piceli.k8s.ops.compare.object_comparer.determine_update_action",
+    with mock.patch.object(
+        loader, "load_all", return_value=[k8s_object]
+    ), mock.patch.object(
+        ManagerFactory, "get_manager"
+    ) as mock_get_manager, mock.patch.object(
+        object_comparer,
+        "determine_update_action",
         side_effect=lambda x, y: obj_compare_result.compared_result,
     ):
         mock_get_manager.return_value = obj_compare_result.desired_obj
@@ -78,13 +80,15 @@ def test_detail_with_no_changes(k8s_object: K8sObject) -> None:
         compared_result=compare_result_no_changes,
     )
 
-    with mock.patch(
-        "piceli.k8s.ops.loader.load_all", return_value=[k8s_object]
-    ), mock.patch(
-        "piceli.k8s.object_manager.factory.ManagerFactory.get_manager",
+    with mock.patch.object(
+        loader, "load_all", return_value=[k8s_object]
+    ), mock.patch.object(
+        ManagerFactory,
+        "get_manager",
         return_value=obj_compare_result_no_changes.desired_obj,
-    ), mock.patch(
-        "piceli.k8s.ops.compare.object_comparer.determine_update_action",
+    ), mock.patch.object(
+        object_comparer,
+        "determine_update_action",
         return_value=compare_result_no_changes,
     ):
         # check no changes: shows no action needed and differences
@@ -100,11 +104,9 @@ def test_detail_with_no_changes(k8s_object: K8sObject) -> None:
 
 
 def test_detail_with_error(k8s_object: K8sObject) -> None:
-    with mock.patch(
-        "piceli.k8s.ops.loader.load_all", return_value=[k8s_object]
-    ), mock.patch(
-        "piceli.k8s.object_manager.factory.ManagerFactory.get_manager"
-    ) as mock_get_manager:
+    with mock.patch.object(
+        loader, "load_all", return_value=[k8s_object]
+    ), mock.patch.object(ManagerFactory, "get_manager") as mock_get_manager:
         mock_get_manager.side_effect = Exception("cannot get manager")
 
         result = runner.invoke(app, ["deploy", "detail"])
@@ -114,7 +116,7 @@ def test_detail_with_error(k8s_object: K8sObject) -> None:
 
 
 def test_detail_no_kubernetes_objects_found() -> None:
-    with mock.patch("piceli.k8s.ops.loader.load_all", return_value=[]):
+    with mock.patch.object(loader, "load_all", return_value=[]):
         result = runner.invoke(app, ["deploy", "detail"])
 
         assert result.exit_code == 0
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from piceli.k8s.cli.deploy import detail
+from piceli.k8s.object_manager.base import ObjectManager
 from piceli.k8s.ops.compare import object_comparer
 
 
@@ -145,7 +146,7 @@ def obj_compare_result_with_differences() -> detail.ObjCompareResult:
         differences=differences,
     )
 
-    desired_obj = MagicMock(spec=detail.ObjectManager)
+    desired_obj = MagicMock(spec=ObjectManager)
     desired_obj.k8s_object = MagicMock()
 
     return detail.ObjCompareResult(
@@ -1,9 +1,12 @@
 from unittest import mock
 
 import pytest
+import typer
 from typer.testing import CliRunner
 
 from piceli.k8s.cli import app
+from piceli.k8s.cli.context import ContextObject
+from piceli.k8s.cli.deploy.plan import plan
 from piceli.k8s.k8s_objects.base import K8sObject
 from piceli.k8s.ops.deploy.deployment_graph import DeploymentGraph
 from piceli.k8s.ops.deploy.strategy_auto import StrategyAuto
@@ -11,12 +14,26 @@ from piceli.k8s.ops.deploy.strategy_auto import StrategyAuto
 runner = CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def deployment_graph(k8s_objects: list[K8sObject]) -> DeploymentGraph:
+    # validating and planning only read the graph, it can be shared
     strategy = StrategyAuto()
     return strategy.build_deployment_graph(k8s_objects)
 
 
+@pytest.fixture
+def typer_ctx() -> typer.Context:
+    """Context for calling the command in process, the loader is patched"""
+    ctx_obj = ContextObject(
+        namespace="default",
+        module_name="test_module",
+        module_path="/path/to/test/module",
+        folder_path="/path/to/test/folder",
+        sub_elements=True,
+    )
+    return mock.Mock(spec=typer.Context, obj=ctx_obj)
+
+
 def test_plan_without_validation(k8s_objects: list[K8sObject]) -> None:
     with mock.patch("piceli.k8s.ops.loader.load_all", return_value=k8s_objects):
         result = runner.invoke(app, ["deploy", "plan"])
@@ -30,20 +47,27 @@ def test_plan_without_validation(k8s_objects: list[K8sObject]) -> None:
 def test_plan_with_validation_success(
     k8s_objects: list[K8sObject],
     deployment_graph: DeploymentGraph,
+    typer_ctx: typer.Context,
+    capsys: pytest.CaptureFixture[str],
 ) -> None:
+    # the option parsing is covered by test_plan_without_validation
     with mock.patch(
         "piceli.k8s.ops.loader.load_all", return_value=k8s_objects
     ), mock.patch(
         "piceli.k8s.ops.deploy.strategy_auto.StrategyAuto.build_deployment_graph",
         return_value=deployment_graph,
     ):
-        result = runner.invoke(app, ["deploy", "plan", "--validate"])
-        assert result.exit_code == 0
-        assert "Validation successful" in result.stdout
-        assert "Kubernetes Deployment Plan" in result.stdout
+        plan(typer_ctx, validate=True)
+        stdout = capsys.readouterr().out
+        assert "Validation successful" in stdout
+        assert "Kubernetes Deployment Plan" in stdout
 
 
-def test_plan_with_validation_failure(k8s_objects: list[K8sObject]) -> None:
+def test_plan_with_validation_failure(
+    k8s_objects: list[K8sObject],
+    typer_ctx: typer.Context,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
     class MockFailingGraph:
         def validate(self) -> None:
             raise ValueError("Mock validation failure")
@@ -54,7 +78,7 @@ def test_plan_with_validation_failure(k8s_objects: list[K8sObject]) -> None:
         "piceli.k8s.ops.deploy.strategy_auto.StrategyAuto.build_deployment_graph",
         return_value=MockFailingGraph(),
     ):
-        result = runner.invoke(app, ["deploy", "plan", "--validate"])
-        assert result.exit_code == 0
-        assert "Mock validation failure" in result.stdout
-        assert "Validation error" in result.stdout
+        plan(typer_ctx, validate=True)
+        stdout = capsys.readouterr().out
+        assert "Mock validation failure" in stdout
+        assert "Validation error" in stdout
@@ -1,10 +1,15 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
 
 import pytest
+from kubernetes.client.exceptions import ApiException
 from typer.testing import CliRunner
 
 from piceli.k8s.cli import app
 from piceli.k8s.cli.context import ContextObject
+from piceli.k8s.cli.deploy import run
+from piceli.k8s.exceptions import api_exceptions
 from piceli.k8s.k8s_client.client import ClientContext
 from piceli.k8s.ops.deploy.deployment_executor import (
     DeploymentExecutor,
@@ -30,15 +35,15 @@ def ctx_object() -> ContextObject:
 @pytest.fixture
 def deployment_executor_mock() -> DeploymentExecutor:
     """Fixture for creating a mock deployment executor."""
-    mock = AsyncMock(spec=DeploymentExecutor)
-    # Configure the mock as needed for your tests
-    return mock
+    # the spec is required: it makes the async methods of the executor awaitable
+    return MagicMock(spec=DeploymentExecutor)
 
 
 @pytest.fixture
 def strategy_auto_mock(deployment_executor_mock: DeploymentExecutor) -> StrategyAuto:
     """Fixture for creating a mock strategy auto object."""
-    mock = AsyncMock(spec=StrategyAuto)
+    # no spec, the command output is checked, not the calls to the strategy
+    mock = MagicMock()
     mock.build_deployment_graph.return_value = deployment_executor_mock
     return mock
 
@@ -46,26 +51,23 @@ def strategy_auto_mock(deployment_executor_mock: DeploymentExecutor) -> Strategy
 @pytest.fixture
 def client_context_mock() -> ClientContext:
     """Fixture for creating a mock client context."""
-    return AsyncMock(spec=ClientContext)
+    return MagicMock()
 
 
 @pytest.mark.asyncio
 def test_run_command_success(
     ctx_object: ContextObject,
-    strategy_auto_mock: DeploymentExecutor,
+    strategy_auto_mock: MagicMock,
     client_context_mock: ClientContext,
-    deployment_executor_mock: DeploymentExecutor,
+    deployment_executor_mock: MagicMock,
 ) -> None:
     """Test that the run command executes successfully."""
-    strategy_auto_mock = MagicMock(spec=StrategyAuto)
     deployment_graph_mock = MagicMock()
     deployment_graph_mock.validate.return_value = None
     strategy_auto_mock.build_deployment_graph.return_value = deployment_graph_mock
-    deployment_executor_mock = MagicMock(spec=DeploymentExecutor)
     deployment_executor_mock.graph = MagicMock()
     deployment_executor_mock.status = ExecutionStatus.DONE
     deployment_executor_mock.deployed_nodes = []
-    client_context_mock = MagicMock(spec=ClientContext)
 
     with patch("piceli.k8s.cli.ContextObject", return_value=ctx_object), patch(
         "piceli.k8s.ops.deploy.strategy_auto.StrategyAuto",
@@ -79,3 +81,52 @@ def test_run_command_success(
         result = runner.invoke(app, ["deploy", "run", "--create-namespace"])
         assert result.exit_code == 0
         assert "Deployment completed successfully" in result.stdout
+
+
+def test_upsert_namespace_forbidden_reads_existing_namespace() -> None:
+    """A user without permission to create namespaces can deploy to an existing one"""
+    forbidden = ApiException(status=403)
+    forbidden.body = (
+        '{"kind":"Status","status":"Failure","reason":"Forbidden","code":403}'
+    )
+    client_ctx = MagicMock()
+    client_ctx.core_api.create_namespace.side_effect = forbidden
+    console = MagicMock()
+
+    run._upsert_namespace(console, "test-namespace", client_ctx)
+
+    client_ctx.core_api.read_namespace.assert_called_once_with(name="test-namespace")
+    assert "already exists" in console.print.call_args.args[0]
+
+
+def test_upsert_namespace_forbidden_and_not_readable() -> None:
+    forbidden = ApiException(status=403)
+    forbidden.body = (
+        '{"kind":"Status","status":"Failure","reason":"Forbidden","code":403}'
+    )
+    client_ctx = MagicMock()
+    client_ctx.core_api.create_namespace.side_effect = forbidden
+    client_ctx.core_api.read_namespace.side_effect = forbidden
+
+    with pytest.raises(api_exceptions.ApiOperationException) as exc_info:
+        run._upsert_namespace(MagicMock(), "test-namespace", client_ctx)
+    assert exc_info.value.forbidden is True
+
+
+def test_prepare_and_run_invalid_graph_does_not_create_namespace() -> None:
+    client_ctx = MagicMock()
+    created = threading.Event()
+    client_ctx.core_api.create_namespace.side_effect = lambda body: created.set()
+
+    def build_invalid_graph(_: list) -> None:
+        # gives a concurrent namespace creation the time to happen
+        created.wait(timeout=0.2)
+        raise ValueError("cycle")
+
+    with patch.object(
+        run, "_build_deployment_graph", side_effect=build_invalid_graph
+    ), pytest.raises(ValueError, match="cycle"):
+        asyncio.run(
+            run._prepare_and_run(MagicMock(), [], "test-namespace", client_ctx, True)
+        )
+    client_ctx.core_api.create_namespace.assert_not_called()
@@ -0,0 +1,21 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from urllib3.exceptions import HTTPError
+
+# the legacy libs only import within their own project layout
+k8s_model_lib = pytest.importorskip("k8s_client.k8s_model_lib")
+
+
+def test_wait_retries_a_transient_http_error() -> None:
+    config_map = k8s_model_lib.ConfigMap(name="config", data={})
+    k8s = MagicMock()
+    k8s.core_api.read_namespaced_config_map.side_effect = [
+        HTTPError("connection reset"),
+        MagicMock(status=None),
+    ]
+
+    with patch.object(k8s_model_lib.K8sModel._wait_exists.retry, "sleep"):
+        config_map.wait(k8s)
+
+    assert k8s.core_api.read_namespaced_config_map.call_count == 2
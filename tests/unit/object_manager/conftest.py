@@ -0,0 +1,14 @@
+import os
+from typing import Callable
+
+import pytest
+
+from piceli.k8s.k8s_objects.base import K8sObject
+from piceli.k8s.object_manager.base import ObjectManager
+
+
+@pytest.fixture
+def cronjob_manager(load_resources: Callable[[str], list[K8sObject]]) -> ObjectManager:
+    test_yaml = os.path.join(os.path.dirname(__file__), "resources", "cronjob.yml")
+    (k8s_object,) = load_resources(test_yaml)
+    return ObjectManager(k8s_object=k8s_object)
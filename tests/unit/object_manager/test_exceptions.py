@@ -21,75 +21,78 @@ def test_api_exception_parser() -> None:
     assert parsed.already_exists is False
 
 
-def test_forbidden_pvc_api_exception() -> None:
-    body = {
-        "kind": "Status",
-        "apiVersion": "v1",
-        "metadata": {},
-        "status": "Failure",
-        "message": (
-            'PersistentVolumeClaim "example-persistentvolumeclaim" is invalid: spec: Forbidden: '
-            "spec is immutable after creation except resources.requests for bound claims\n"
-            "core.PersistentVolumeClaimSpec{\n"
-            '\tAccessModes: {"ReadWriteOnce"},\n'
-            "\tSelector:    nil,\n"
-            "\tResources: core.ResourceRequirements{\n"
-            "\t\tLimits: nil,\n"
-            "- \t\tRequests: core.ResourceList{\n"
-            '- \t\t\ts"storage": {\n'
-            "- \t\t\t\ti:      resource.int64Amount{value: 107374182400, scale: -3},\n"
-            '- \t\t\t\ts:      "107374182400m",\n'
-            '- \t\t\t\tFormat: "DecimalSI",\n'
-            "- \t\t\t},\n"
-            "- \t\t},\n"
-            '+ \t\tRequests: core.ResourceList{s"storage": {d: s"214748364.800", Format: "BinarySI"}},\n'
-            "\t\tClaims:   nil,\n"
-            "\t},\n"
-            '\tVolumeName:       "",\n'
-            '\tStorageClassName: &"standard-rwo",\n'
-            "\t... // 3 identical fields\n"
-            "}\n"
-        ),
-        "reason": "Invalid",
-        "details": {
-            "name": "example-persistentvolumeclaim",
-            "kind": "PersistentVolumeClaim",
-            "causes": [
-                {
-                    "reason": "FieldValueForbidden",
-                    "message": (
-                        "Forbidden: spec is immutable after creation except resources.requests for bound claims\n"
-                        "core.PersistentVolumeClaimSpec{\n"
-                        '\tAccessModes: {"ReadWriteOnce"},\n'
-                        "\tSelector:    nil,\n"
-                        "\tResources: core.ResourceRequirements{\n"
-                        "\t\tLimits: nil,\n"
-                        "- \t\tRequests: core.ResourceList{\n"
-                        '- \t\t\ts"storage": {\n'
-                        "- \t\t\t\ti:      resource.int64Amount{value: 107374182400, scale: -3},\n"
-                        '- \t\t\t\ts:      "107374182400m",\n'
-                        '- \t\t\t\tFormat: "DecimalSI",\n'
-                        "- \t\t\t},\n"
-                        "- \t\t},\n"
-                        '+ \t\tRequests: core.ResourceList{s"storage": {d: s"214748364.800", Format: "BinarySI"}},\n'
-                        "\t\tClaims:   nil,\n"
-                        "\t},\n"
-                        '\tVolumeName:       "",\n'
-                        '\tStorageClassName: &"standard-rwo",\n'
-                        "\t... // 3 identical fields\n"
-                        "}\n"
-                    ),
-                    "field": "spec",
-                }
-            ],
-        },
-        "code": 422,
-    }
+FORBIDDEN_PVC_BODY = {
+    "kind": "Status",
+    "apiVersion": "v1",
+    "metadata": {},
+    "status": "Failure",
+    "message": (
+        'PersistentVolumeClaim "example-persistentvolumeclaim" is invalid: spec: Forbidden: '
+        "spec is immutable after creation except resources.requests for bound claims\n"
+        "core.PersistentVolumeClaimSpec{\n"
+        '\tAccessModes: {"ReadWriteOnce"},\n'
+        "\tSelector:    nil,\n"
+        "\tResources: core.ResourceRequirements{\n"
+        "\t\tLimits: nil,\n"
+        "- \t\tRequests: core.ResourceList{\n"
+        '- \t\t\ts"storage": {\n'
+        "- \t\t\t\ti:      resource.int64Amount{value: 107374182400, scale: -3},\n"
+        '- \t\t\t\ts:      "107374182400m",\n'
+        '- \t\t\t\tFormat: "DecimalSI",\n'
+        "- \t\t\t},\n"
+        "- \t\t},\n"
+        '+ \t\tRequests: core.ResourceList{s"storage": {d: s"214748364.800", Format: "BinarySI"}},\n'
+        "\t\tClaims:   nil,\n"
+        "\t},\n"
+        '\tVolumeName:       "",\n'
+        '\tStorageClassName: &"standard-rwo",\n'
+        "\t... // 3 identical fields\n"
+        "}\n"
+    ),
+    "reason": "Invalid",
+    "details": {
+        "name": "example-persistentvolumeclaim",
+        "kind": "PersistentVolumeClaim",
+        "causes": [
+            {
+                "reason": "FieldValueForbidden",
+                "message": (
+                    "Forbidden: spec is immutable after creation except resources.requests for bound claims\n"
+                    "core.PersistentVolumeClaimSpec{\n"
+                    '\tAccessModes: {"ReadWriteOnce"},\n'
+                    "\tSelector:    nil,\n"
+                    "\tResources: core.ResourceRequirements{\n"
+                    "\t\tLimits: nil,\n"
+                    "- \t\tRequests: core.ResourceList{\n"
+                    '- \t\t\ts"storage": {\n'
+                    "- \t\t\t\ti:      resource.int64Amount{value: 107374182400, scale: -3},\n"
+                    '- \t\t\t\ts:      "107374182400m",\n'
+                    '- \t\t\t\tFormat: "DecimalSI",\n'
+                    "- \t\t\t},\n"
+                    "- \t\t},\n"
+                    '+ \t\tRequests: core.ResourceList{s"storage": {d: s"214748364.800", Format: "BinarySI"}},\n'
+                    "\t\tClaims:   nil,\n"
+                    "\t},\n"
+                    '\tVolumeName:       "",\n'
+                    '\tStorageClassName: &"standard-rwo",\n'
+                    "\t... // 3 identical fields\n"
+                    "}\n"
+                ),
+                "field": "spec",
+            }
+        ],
+    },
+    "code": 422,
+}
+# serialized once at import, the test only needs the json string
+FORBIDDEN_PVC_BODY_JSON = json.dumps(FORBIDDEN_PVC_BODY, separators=(",", ":"))
 
+
+def test_forbidden_pvc_api_exception() -> None:
     # Create the ApiException instance
     api = ApiException(status=422)
     api.reason = "Unprocessable Entity"
-    api.body = json.dumps(body)
+    api.body = FORBIDDEN_PVC_BODY_JSON
     api.headers = {
         "Cache-Control": "no-cache, private",
         "Content-Type": "application/json",
@@ -307,6 +307,20 @@ def test_read(client_context: ClientContext, obj_manager: ObjectManager) -> None
         )
 
 
+def test_read_yaml_cronjob(
+    client_context: ClientContext, cronjob_manager: ObjectManager
+) -> None:
+    assert type(cronjob_manager.get_api(client_context)).__name__ == "BatchV1Api"
+    with patch.object(
+        cronjob_manager, "_invoke_api", return_value=cronjob_manager.k8s_object.spec
+    ) as mock_invoke:
+        result = cronjob_manager.read(client_context)
+        assert result.spec == cronjob_manager.k8s_object.spec
+        mock_invoke.assert_called_once_with(
+            client_context, "read", "tasker-schedulerx", "default"
+        )
+
+
 def test_patch(client_context: ClientContext, obj_manager: ObjectManager) -> None:
     with patch.object(obj_manager, "_invoke_api") as mock_invoke:
         obj_manager.patch(client_context)
@@ -19,6 +19,15 @@ def test_find_differences_with_changes() -> None:
     ]
 
 
+def test_path_comparison_compares_values() -> None:
+    path = object_comparer.Path.from_string("spec,replicas")
+    assert object_comparer.PathComparison(path, 1, 2) != object_comparer.PathComparison(
+        path, 1, 3
+    )
+    # hashed by path only, so unhashable values are supported
+    assert hash(object_comparer.PathComparison(path, [1], {"a": 2})) == hash(path)
+
+
 def test_find_differences_with_nested_changes() -> None:
     desired_spec = {"key1": {"nested_key": "new_value"}}
     existing_spec = {"key1": {"nested_key": "old_value"}}
@@ -1,6 +1,8 @@
+import pytest
 from kubernetes import client
 
 from piceli.k8s import constants, templates
+from piceli.k8s.templates.deployable import service_account
 from tests.unit.templates import yaml_utils
 
 CRONJOB = templates.CronJob(
@@ -55,3 +57,27 @@ def test_read_only_role() -> None:
     assert isinstance(objects[0], client.V1Role)
     role_dict = client.ApiClient().sanitize_for_serialization(objects[0])
     assert role_dict == yaml_utils.get_yaml_dict("role_readonly.yml")
+
+
+SA_NAME = "s" * 10
+
+
+@pytest.mark.parametrize(
+    "role_name, expected_name",
+    [
+        # "sa-{sa_name}-role-{role_name}" is exactly 63 chars
+        ("r" * 44, f"sa-{SA_NAME}-role-{'r' * 44}"),
+        ("r" * 45, f"{SA_NAME}-{'r' * 45}"),
+        # "{sa_name}-{role_name}" is exactly 63 chars
+        ("r" * 52, f"{SA_NAME}-{'r' * 52}"),
+    ],
+)
+def test_role_binding_name_length_boundary(role_name: str, expected_name: str) -> None:
+    name = service_account.role_binding_name(SA_NAME, role_name)
+    assert name == expected_name
+    assert len(name) <= service_account.MAX_NAME_LENGTH
+
+
+def test_role_binding_name_too_long() -> None:
+    with pytest.raises(ValueError, match="is too long"):
+        service_account.role_binding_name(SA_NAME, "r" * 53)
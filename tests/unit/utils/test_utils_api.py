@@ -18,6 +18,12 @@ def test_get_available_api_methods() -> None:
     ]
 
 
+def test_get_available_api_methods_returns_a_copy() -> None:
+    api_methods = utils_api.get_available_api_methods(client.BatchV1Api, "job")
+    api_methods.clear()
+    assert utils_api.get_available_api_methods(client.BatchV1Api, "job")
+
+
 def test_is_namespaced() -> None:
     api_methods = ["create_namespaced_job", "delete_collection_namespaced_job", "..."]
     assert utils_api.is_namespaced(api_methods) is True
@@ -50,3 +56,5 @@ def test_build_api_method_name() -> None:
 def test_get_api_func_ending() -> None:
     kind = "CronJob"
     assert utils_api.get_api_func_ending(kind) == "cron_job"
+    assert utils_api.get_api_func_ending("APIService") == "api_service"
+    assert utils_api.get_api_func_ending("V1Beta1Event") == "v1_beta1_event"